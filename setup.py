@@ -30,6 +30,6 @@ setuptools.setup(
          "numpy>=1.15",
          "scipy>=1.2",
          "matplotlib>=1.4.3",
-         "scikit-learn>=0.20",
+         "scikit-learn>=1.1",
          "scikit-image>=0.16"]
  )
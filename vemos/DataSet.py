@@ -17,6 +17,7 @@ import pickle
 import re as re
 from functools import partial
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
 
 import PyQt5.QtGui as qtgui
 import PyQt5.QtWidgets as qtw
@@ -28,6 +29,10 @@ from skimage import metrics
 from sklearn import svm
 
 
+# Seconds between repaints while a data set is pickled in the background
+SAVE_POLL_SECONDS = 0.05
+
+
 class DataRecord:
     """Represents one element of a data set for the PatternAnalyzer GUI.
 
@@ -133,11 +138,23 @@ class DataSet:
         Dict of the match scores, nonmatch scores, all scores, and ground truth
         values for each (flattened) matrix.
         "gt" stores 1 at index i if the record pair at index i is matched,
-        and 0 otherwise.
+        and 0 otherwise. "match scores", "nonmatch scores" and "all scores"
+        hold the scores of "matches", "nonmatches" and "all" as arrays,
+        "sorted match scores" and "sorted nonmatch scores" hold the first two
+        in ascending order, "gt array" holds "gt" as an array, and "min score"
+        and "max score" hold the range of "all scores".
         Format: {matrix_name: {"match": [ID1, ...]
                                "nonmatch": [ID2, ...]
                                "all": [ID1, ID2,...]
-                               "gt": [1, 0, ...]}}
+                               "gt": [1, 0, ...],
+                               "match scores": array([score1, ...]),
+                               "nonmatch scores": array([score2, ...]),
+                               "sorted match scores": array([...]),
+                               "sorted nonmatch scores": array([...]),
+                               "all scores": array([score1, score2, ...]),
+                               "gt array": array([1, 0, ...]),
+                               "min score": score_min,
+                               "max score": score_max}}
 
     loading_widget : QWidget
         The widget that displays loadign options.
@@ -1782,6 +1799,30 @@ class DataSet:
                         self.match_nonmatch_scores[matrix_name]["gt"].append(
                             ground_truth_options.index(match_type))
 
+        # Stores the scores alone as arrays for vectorized analyses
+        for matrix_name in self.match_nonmatch_scores:
+            mnm_scores = self.match_nonmatch_scores[matrix_name]
+            mnm_scores["match scores"] = np.array(
+                [row[0] for row in mnm_scores["matches"]], dtype=float)
+            mnm_scores["nonmatch scores"] = np.array(
+                [row[0] for row in mnm_scores["nonmatches"]], dtype=float)
+            mnm_scores["all scores"] = np.array(
+                [row[0] for row in mnm_scores["all"]], dtype=float)
+            mnm_scores["gt array"] = np.array(mnm_scores["gt"], dtype=np.int8)
+
+            # Sorted once, for counting the scores on either side of a score
+            mnm_scores["sorted match scores"] = np.sort(
+                mnm_scores["match scores"])
+            mnm_scores["sorted nonmatch scores"] = np.sort(
+                mnm_scores["nonmatch scores"])
+
+            # Range of the scores, e.g. for plot limits (NaN if no scores)
+            all_scores = mnm_scores["all scores"]
+            mnm_scores["min score"] = float(all_scores.min()) if len(
+                all_scores) else np.nan
+            mnm_scores["max score"] = float(all_scores.max()) if len(
+                all_scores) else np.nan
+
         return True
 
 ###############################################################################
@@ -2509,6 +2550,27 @@ class DataSet:
         return -1
 
 
+    def records_by_id(self):
+        """ Returns a dictionary of the DataRecords, keyed by ID.
+
+        For looking up many records at once; each lookup is constant time,
+        rather than the linear search of `record_from_id`.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        records : dict of {str : DataRecord}
+            The records, keyed by ID (the first record with each ID, as in
+            `record_from_id`).
+
+        """
+
+        return {record.id: record for record in reversed(self.records)}
+
+
     def index_from_id(self, id_num):
         """ Given an ID, returns the corresponding index in the record list.
 
@@ -2691,6 +2753,10 @@ class DataSet:
     def save(self, window, ask=True):
         """ Pickles the current data set.
 
+        The data set is pickled in a worker thread while the windows keep
+        processing events, so callers should stop anything (e.g., timers)
+        that changes the data set until this returns.
+
         Parameters
         ----------
         window: QMainWindow
@@ -2731,19 +2797,28 @@ class DataSet:
             self.name = item
 
             folder = os.path.dirname(os.path.realpath(__file__))
-            save_file = open(os.path.join(folder, self.name + ".p"), "wb")
-
-            pickle.dump(self.name, save_file)
-            pickle.dump(self.directory_path, save_file)
-            pickle.dump(self.description_path, save_file)
-            pickle.dump(self.matrix_directory, save_file)
-            pickle.dump(self.matrices, save_file)
-            pickle.dump(self.records, save_file)
-            pickle.dump(self.groupings, save_file)
-            pickle.dump(self.data_types, save_file)
-            pickle.dump(self.has_files, save_file)
-
-            save_file.close()
+            path = os.path.join(folder, self.name + ".p")
+
+            progress_dialog = qtw.QProgressDialog(
+                "Saving " + self.name + "...", None, 0, 0, window)
+            progress_dialog.setWindowModality(qtcore.Qt.ApplicationModal)
+            progress_dialog.resize(500,100)
+            progress_dialog.setWindowIcon(self.icon)
+            progress_dialog.setWindowTitle("VEMOS")
+            progress_dialog.show()
+
+            # Pickles in a worker thread so the windows keep repainting while
+            # a large data set is written; leaving the with block waits for
+            # the worker even if repainting raises
+            try:
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    future = executor.submit(self.write_pickle, path)
+                    while not wait([future], timeout=SAVE_POLL_SECONDS).done:
+                        qtw.QApplication.processEvents()
+            finally:
+                progress_dialog.close()
+
+            future.result()
             return True
 
         except (IOError, PermissionError) as e:
@@ -2751,6 +2826,35 @@ class DataSet:
             return False
 
 
+    def write_pickle(self, path):
+        """ Pickles the data set's contents to a file.
+
+        The objects are pickled one after another, in the order
+        `load_from_pickle` reads them.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file to write.
+
+        Returns
+        -------
+        None
+
+        See Also
+        --------
+        save: Asks for a name and pickles the data set.
+        """
+
+        with open(path, "wb") as save_file:
+            for to_save in (self.name, self.directory_path,
+                            self.description_path, self.matrix_directory,
+                            self.matrices, self.records, self.groupings,
+                            self.data_types, self.has_files):
+                pickle.dump(to_save, save_file,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+
+
     def cancel(self, event):
         """ Closes the loading widget when the user clicks "Cancel".
 
@@ -5,7 +5,7 @@ Visual Record Browser GUIs.
 
 import os
 import gc
-from functools import partial
+from functools import partial, lru_cache
 import numpy as np
 import matplotlib as mpl
 import matplotlib.pyplot as plt
@@ -18,6 +18,56 @@ import PyQt5.QtGui as qtgui
 import PyQt5.QtWidgets as qtw
 import PyQt5.QtCore as qtcore
 
+# The number of text files whose contents are kept for redisplaying them
+TEXT_CACHE_SIZE = 256
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def read_text_file(path, mtime):
+    """Returns the text of a file, reusing it while the file is unchanged.
+
+    Parameters
+    ----------
+    path : str
+        The file path to the text.
+    mtime : float
+        The file's modification time, so that edited files are read again.
+
+    Returns
+    -------
+    text : str
+        The text of the file.
+
+    """
+
+    with open(path, "r") as text_file:
+        return text_file.read()
+
+@lru_cache(maxsize=None)
+def get_font(point_size, bold=False):
+    """Returns a shared font, made the first time it is requested.
+
+    Widgets copy the fonts they are given, so one font can be passed to
+    any number of widgets.
+
+    Parameters
+    ----------
+    point_size : int
+        The font's point size.
+    bold : {False, True}, optional
+        Whether the font is bold.
+
+    Returns
+    -------
+    font : QFont
+        The font.
+
+    """
+
+    font = qtgui.QFont()
+    font.setPointSize(point_size)
+    font.setBold(bold)
+    return font
+
 class GUIBackend(object):
     """Provides methods for setting up the visualization GUIs.
 
@@ -556,17 +606,14 @@ class GUIBackend(object):
             text = "File Unavailable"
         else:
             try:
-                with open(path, "r") as text_file:
-                    text = text_file.read()
+                text = read_text_file(path, os.path.getmtime(path))
             except (IOError, OSError, UnicodeDecodeError,
                     SyntaxError) as e:
-                self.gb.loading_error("text description", v2=True, details=e)
+                self.loading_error("text description", v2=True, details=e)
                 text = "File Unavailable"
 
         edit = qtw.QTextEdit(text)
-        font = qtgui.QFont()
-        font.setPointSize(10)
-        edit.setFont(font)
+        edit.setFont(get_font(10))
         edit.setReadOnly(True)
 
         return edit
@@ -12,7 +12,8 @@ import matplotlib.pyplot as plt
 import math
 import inspect
 from textwrap import wrap
-from functools import partial
+from functools import partial, lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 import PyQt5.QtGui as qtgui
 import PyQt5.QtWidgets as qtw
@@ -28,14 +29,56 @@ from matplotlib.widgets import (LassoSelector, RectangleSelector, Button,
     MultiCursor)
 from matplotlib.figure import Figure
 from mpl_toolkits.mplot3d import Axes3D
-from scipy import stats
+from scipy import stats, signal, sparse
 from sklearn.manifold import MDS
 from sklearn.cluster import KMeans, spectral_clustering, dbscan
-from sklearn.metrics import roc_curve, auc
+from sklearn.metrics import auc
 from sklearn.metrics.pairwise import pairwise_distances
 from scipy.cluster.hierarchy import dendrogram, linkage, to_tree
+from scipy.spatial.distance import squareform, is_valid_dm
 
-from .GUIBackend import GUIBackend
+from .GUIBackend import GUIBackend, get_font
+
+# Row and column labels of the rank tables below match visualizations
+RANK_TABLE_HLABELS = ["Left (lower)", "Right (higher)", "Total"]
+RANK_TABLE_VLABELS = ["Known Matches: Quantity", "Known Non-Matches: Quantity",
+                      "Known Matches: Percent", "Known Non-Matches: Percent"]
+
+# Smooth histograms of more scores than this use the binned FFT-based KDE
+FFT_KDE_MIN_SCORES = 5000
+FFT_KDE_GRID_SIZE = 4096
+
+# Hover handlers run at most once per this many milliseconds (about a frame)
+HOVER_INTERVAL_MS = 16
+
+# Box style of the notes pinned to match visualizations (annotations copy it)
+PINNED_NOTE_BBOX = dict(boxstyle="round", fc="w")
+
+# Spectral clustering of more records than this uses a sparse affinity matrix
+# that keeps each record's nearest neighbors
+SPARSE_SPECTRAL_MIN_RECORDS = 1000
+SPARSE_SPECTRAL_NEIGHBORS = 30
+
+# Number of score labels kept by format_score
+SCORE_TEXT_CACHE_SIZE = 1024
+
+@lru_cache(maxsize=SCORE_TEXT_CACHE_SIZE)
+def format_score(score):
+    """Returns a score's label, reused when the same score is pinned again.
+
+    Parameters
+    ----------
+    score : float
+        The score, rate, or other value to label.
+
+    Returns
+    -------
+    label : str
+        The score to three significant digits.
+
+    """
+
+    return format(score, '.3g')
 
 class VisualMetricAnalyzer(qtw.QMainWindow):
     """The main GUI for examining a data set's similarity/dissimilarity scores.
@@ -58,6 +101,47 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         The number of plots to display per matplotlib figure.
     selection_id : int
         The ID of the current figure being displayed.
+    mds_dtype : numpy.dtype
+        The precision of the score matrices passed to MDS (float32 by
+        default; use float64 for full precision).
+    cluster_dtype : numpy.dtype
+        The precision of the score matrices passed to hierarchical and
+        spectral clustering (float32 by default; use float64 for full
+        precision).
+    roc_cache : dict of {str : tuple}
+        The ROC curve of each matrix as (scores, false positive rates, true
+        positive rates, thresholds, AUC), reused while the matrix's scores
+        stay the same.
+    score_order_cache : dict of {str : tuple}
+        Each matrix's flattened scores (rounded to 7 decimals) in sorted
+        order, as (matrix, flat indices in sorted order, sorted scores), for
+        looking up the record pairs with given scores.
+    cluster_mds_cache : dict of {str : tuple}
+        The 2D MDS view of each matrix in the spectral clustering as (matrix,
+        points), reused while the data set keeps the same matrix.
+    cluster_parameters : dict of {function : list}
+        The (name, inspect.Parameter) pairs of each clustering function's
+        parameters, as used by `get_cluster_args`.
+    linkage_cache : dict of {tuple : tuple}
+        The hierarchical clustering of each matrix with each linkage method,
+        keyed by (matrix name, method), as (matrix, linkage matrix), reused
+        while the data set keeps the same matrix.
+    record_lookup : tuple
+        The data set's records keyed by ID, as (record list, its length,
+        dict of records), reused while the record list stays the same.
+    score_bounds_cache : tuple
+        The (min score, max score) of each selected matrix, as (list of the
+        matrices' score dicts in `match_nonmatch_scores`, array of ranges),
+        reused while the same score dicts are selected.
+    note_lookup : dict of {str : dict}
+        For each plot type, the annotations with each text: the notes of the
+        grouped MDS plots, and the (list index, index) positions in
+        `annotations["cluster"]` of the dendrograms' notes.
+    text_info : dict of {QStackedWidget : tuple}
+        The records shown in each window of text descriptions, its data type,
+        the number of records per page and its Previous and Next buttons, as
+        (records, data type, records per page, previous button, next button),
+        for building its pages as they are paged to.
 
     cluster_method : str
         The current method to use for clustering.
@@ -88,8 +172,16 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
     figure_info : dict
         Stores information about the matplotlib figures being displayed.
     selectors : list of matplotlib.widgets._SelectorWidget
-        Maintains a reference to the current selector for each open
-        figure.
+        Maintains a reference to the ROC curves' selectors.
+    mds_selectors : dict of {str : list}
+        The 2D MDS plots' "Rectangle" and "Lasso" selectors, of which only
+        one type is active.
+    cluster_selector : matplotlib.widgets._SelectorWidget
+        The spectral clustering's selector, which is moved to whichever plot
+        the mouse enters.
+    cluster_rect_select : bool
+        True if the spectral clustering's selector is a rectangle selector and
+        False if it is a lasso selector.
     artists : dict of {str : list}
         The current artists for the 2D, 3D, match visualization, and clustering
         plots.
@@ -110,19 +202,32 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         # Tracks information that should stay the same even after update_data
         self.show_table = True
         self.selection_id = 0
+        self.mds_dtype = np.float32
+        self.cluster_dtype = np.float32
+        self.roc_cache = {}
+        self.score_order_cache = {}
+        self.cluster_mds_cache = {}
+        self.linkage_cache = {}
+        self.record_lookup = None
+        self.score_bounds_cache = None
+        self.cluster_parameters = {}
 
         self.cluster_method = "Spectral"
         self.cluster_methods = {"Hierarchical": self.hierarchical_clustering,
                                 "Spectral": self.show_spectral_clustering}
-        # eigen_solver must be arpack; assign_labels must be default
+        # eigen_solver must be arpack; assign_labels is cluster_qr, which is
+        # deterministic and faster than k-means, so there are no k-means runs
+        # (n_init) to choose
         self.spectral_prefs = {"n_clusters": [3], "n_components": [3],
-                               "n_init": [10], "eigen_tol": [0.0]}
+                               "eigen_tol": [0.0],
+                               "eigen_solver": ["arpack"],
+                               "assign_labels": ["cluster_qr"]}
         self.hier_prefs = {"method": ["Ward"], "p": [20], "truncate_mode":
                            ["none"], "orientation": ["top"], "no_labels":
                            [True], "leaf_rotation": [90.]}
         self.settings = {"Plots per page": [4], "Marker color": ["Red"],
                         "Marker shape": ["Point"], "Heat map coloring":
-                        ["Color"]}
+                        ["Color"], "Pinned notes": ["Fixed"]}
 
         self.color_options = {"Blue": "b", "Red": "r", "Green": "g",
                               "Cyan": "c", "Magenta": "m", "Yellow": "y",
@@ -229,6 +334,7 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         self.selected_records = []
         self.figure_info = {}
         self.text_widgets = []
+        self.text_info = {}
 
         self.current_axes = None # For mv_widget
         self.current_2d_axes = None
@@ -242,7 +348,14 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
 
         self.mv_widget = None
         self.interpolation_scores = []
+        # The x and y values of the points of each plot. For the MDS, ROC
+        # and spectral clustering plots, a (2, N) array that is the transpose
+        # of an (N, 2) array, so selections test points without copying them
         self.cur_points = []
+        # The spectral clustering's points, kept apart from `cur_points` so
+        # that its window works while other plots are opened
+        self.cluster_points = []
+        self.smooth_xs = []
         self.use_1_plot = False
         self.cluster_grouping_index = 1
 
@@ -251,14 +364,30 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
 
         self.artists = {"2d": [], "3d": [], "mv": [], "cluster": []}
         self.annotations = {"2d": [], "3d": [], "mv": [], "cluster": []}
+        self.note_lookup = {"2d": {}, "3d": {}, "cluster": {}}
         self.pt_index_mv = None
+        self.mv_note_pair = None
         self.pt_index_cluster = None
         self.pt_index_2d = None
         self.pt_index_3d = None
         self.cur_note = None
         self.cur_mv_note = None
+        self.mv_shown_notes = []
+        self.mv_pair_indices = []
+        self.mv_sorted_scores = []
+
+        # Mouse motion only stores the latest event; the timer passes it to
+        # its hover handler
+        self.pending_hover = None
+        self.hover_timer = qtcore.QTimer()
+        self.hover_timer.setSingleShot(True)
+        self.hover_timer.setInterval(HOVER_INTERVAL_MS)
+        self.hover_timer.timeout.connect(self.run_pending_hover)
 
         self.selectors = []
+        self.mds_selectors = {"Rectangle": [], "Lasso": []}
+        self.cluster_selector = None
+        self.cluster_rect_select = True
 
         self.cluster_widget = None
         self.options_widget = None
@@ -266,8 +395,8 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
 
         # Checks if ground truth values are available for match visualizations
         for matrix in self.data_set.matrices:
-            if ((not 0 in self.data_set.match_nonmatch_scores[matrix]["gt"]) or
-                (not 1 in self.data_set.match_nonmatch_scores[matrix]["gt"])):
+            gt = self.data_set.match_nonmatch_scores[matrix]["gt array"]
+            if gt.all() or not gt.any():
                 self.match_menu.setDisabled(True)
                 break
         else:
@@ -554,6 +683,12 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
 
             # Sets up display
             self.selected_records=[]
+            self.roc_cache = {}
+            self.score_order_cache = {}
+            self.cluster_mds_cache = {}
+            self.linkage_cache = {}
+            self.record_lookup = None
+            self.score_bounds_cache = None
             if self.data_set.interface_to_open == "Visual Metric Analyzer":
                 self.create_main_frame()
                 self.data_set.num_widgets_open += 1
@@ -647,6 +782,15 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
                 items=shapes, index=shapes.index(cur_shape),
                 add_to=self.settings["Marker shape"], is_partial=True), 4, 1)
 
+        # Draggable notes each add a pick handler to the canvas
+        cur_notes = str(self.settings["Pinned notes"][0]).capitalize()
+        note_options = ["Fixed", "Draggable"]
+        settings_layout.addWidget(qtw.QLabel("Pinned notes"), 5, 0)
+        settings_layout.addWidget(self.gb.make_widget(
+            qtw.QComboBox(), "currentIndexChanged", self.update_pref,
+            items=note_options, index=note_options.index(cur_notes),
+            add_to=self.settings["Pinned notes"], is_partial=True), 5, 1)
+
         cur_heat = str(self.settings["Heat map coloring"][0]).capitalize()
         cur_heat_index = ["Color", "Grayscale"].index(cur_heat)
         settings_layout.addWidget(qtw.QLabel("Heat map coloring"), 7, 0)
@@ -762,36 +906,44 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
             self.gb.no_selection_error()
             return
 
-        if self.fig_2d:
-            plt.close(self.fig_2d)
-            self.fig_2d = None
-            gc.collect()
-
         self.mv_plot_type = "mds2d"
 
-        # Creates the plot
+        # Creates the plot, clearing and reusing the figure if it is open
         fsize = (8*len(self.selected_matrices), 8)
-        self.fig_2d, self.current_2d_axes = plt.subplots(
-            1, len(self.selected_matrices), figsize=fsize)
-        if len(self.selected_matrices) == 1:
-            self.current_2d_axes = [self.current_2d_axes]
+        new_figure = not (self.fig_2d and
+                          plt.fignum_exists(self.fig_2d.number))
+        if new_figure:
+            self.fig_2d = plt.figure(figsize=fsize)
+        else:
+            self.fig_2d.clf()
+            self.fig_2d.set_size_inches(fsize)
+
+        self.current_2d_axes = [
+            self.fig_2d.add_subplot(1, len(self.selected_matrices), index+1)
+            for index in range(len(self.selected_matrices))]
         self.fig_2d.suptitle("2D Multidimensional Scaling", fontsize=18)
 
         self.annotations["2d"] = []
+        self.note_lookup["2d"] = {}
         self.artists["2d"] = []
         self.cur_points = []
-        self.selectors = []
+        self.mds_selectors = {"Rectangle": [], "Lasso": []}
         cur_marker = self.marker_style_options[
             self.settings["Marker shape"][0].capitalize()]
 
         for matrix_index, matrix_name in enumerate(self.selected_matrices):
 
+            # Changing the dtype copies the matrix; otherwise, nan_to_num
+            # copies it, leaving the data set's matrix as is
             cur_matrix = self.data_set.matrices[matrix_name]["matrix"]
-            score_matrix0 = np.nan_to_num(np.array(cur_matrix))
+            score_matrix0 = np.asarray(cur_matrix, dtype=self.mds_dtype)
+            score_matrix0 = np.nan_to_num(score_matrix0,
+                                          copy=score_matrix0 is cur_matrix)
             score_matrix = np.maximum(score_matrix0, score_matrix0.T)
             mds2 = MDS(2, dissimilarity='precomputed')
-            x, y = mds2.fit_transform(score_matrix).T # For 0-179
-            self.cur_points.append([x, y])
+            points = mds2.fit_transform(score_matrix).T # For 0-179
+            x, y = points
+            self.cur_points.append(points)
 
             self.current_2d_axes[matrix_index].set_title(matrix_name)
 
@@ -810,34 +962,26 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
                                                "grouping.")
                         continue
 
-                # Adds IDs as annotations
-                self.annotations["2d"].append({})
-                self.artists["2d"].append({})
-                grouping = self.data_set.groupings[grouping_name]
-                for group in grouping:
-
-                    x_coords = []
-                    y_coords = []
-
-                    group_annotations = []
-                    for cur_id in grouping[group]:
-                        cur_index = self.data_set.index_from_id(cur_id)
-                        x_coords.append(x[cur_index])
-                        y_coords.append(y[cur_index])
-
-                        note = self.current_2d_axes[matrix_index].annotate(
-                            cur_id, xy=(x[cur_index], y[cur_index]),
-                            arrowprops=dict(arrowstyle='->'),
-                            bbox=dict(boxstyle="round", fc="w"))
-                        note.set_visible(False)
-                        group_annotations.append(note)
+                # Plots all groups as one collection, colored by group
+                point_indices, point_colors = self.group_point_indices(
+                    grouping_name)
+                cur_artist = self.current_2d_axes[matrix_index].scatter(
+                    x[point_indices], y[point_indices], c=point_colors,
+                    marker=cur_marker, picker=10)
+                self.artists["2d"].append(cur_artist)
 
-                    self.annotations[
-                        "2d"][matrix_index][group] = group_annotations
-                    cur_artist, = self.current_2d_axes[matrix_index].plot(
-                        x_coords, y_coords, marker=cur_marker, ls="",
-                        picker=10)
-                    self.artists["2d"][matrix_index][group] = cur_artist
+                # Adds IDs as annotations (in the same order as the points)
+                self.annotations["2d"].append([])
+                for cur_index in point_indices:
+                    note = self.current_2d_axes[matrix_index].annotate(
+                        self.data_set.records[cur_index].id,
+                        xy=(x[cur_index], y[cur_index]),
+                        arrowprops=dict(arrowstyle='->'),
+                        bbox=dict(boxstyle="round", fc="w"))
+                    note.set_visible(False)
+                    self.annotations["2d"][matrix_index].append(note)
+                    self.note_lookup["2d"].setdefault(
+                        self.data_set.records[cur_index].id, []).append(note)
 
 
             else:
@@ -857,24 +1001,24 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
                     note.set_visible(False)
                     self.annotations["2d"][matrix_index].append(note)
 
-            self.selectors.append(RectangleSelector(
+            self.mds_selectors["Rectangle"].append(RectangleSelector(
                 self.current_2d_axes[matrix_index],
                 partial(self.plot_rect, matrix_index)))
 
-        self.current_2d_axes[matrix_index].get_figure().canvas.draw()
-
         # Adds buttons and selectors
-        axbutton = plt.axes([.88, .01, .11, .051])
+        axbutton = self.fig_2d.add_axes([.88, .01, .11, .051])
         self.lasso_rect = Button(axbutton, "Lasso")
         self.lasso_rect.on_clicked(self.mds_selector_change)
 
-        self.color_button = Button(plt.axes([.01, .01, .31, .051]),
+        self.color_button = Button(self.fig_2d.add_axes([.01, .01, .31, .051]),
                                    "Color by Grouping")
         self.color_button.on_clicked(partial(self.color_by_grouping, "2d"))
 
-        self.fig_2d.canvas.mpl_connect("motion_notify_event",
-                                       partial(self.plot_hover, "2d"))
-        self.fig_2d.canvas.mpl_connect('pick_event', self.plot_pick)
+        self.fig_2d.canvas.draw_idle()
+        if new_figure:
+            self.fig_2d.canvas.mpl_connect("motion_notify_event", partial(
+                self.throttle_hover, partial(self.plot_hover, "2d")))
+            self.fig_2d.canvas.mpl_connect('pick_event', self.plot_pick)
 
         plt.show()
 
@@ -899,19 +1043,22 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
             self.gb.no_selection_error()
             return
 
-        if self.fig_3d:
-            plt.close(self.fig_3d)
-            self.fig_3d = None
-            gc.collect()
-
         self.mv_plot_type = "mds3d"
 
-        # Creates the plot
-        self.fig_3d = plt.figure(figsize=(8*len(self.selected_matrices), 8))
+        # Creates the plot, clearing and reusing the figure if it is open
+        fsize = (8*len(self.selected_matrices), 8)
+        new_figure = not (self.fig_3d and
+                          plt.fignum_exists(self.fig_3d.number))
+        if new_figure:
+            self.fig_3d = plt.figure(figsize=fsize)
+        else:
+            self.fig_3d.clf()
+            self.fig_3d.set_size_inches(fsize)
         self.fig_3d.suptitle("3D Multidimensional Scaling", fontsize=18)
 
         self.current_3d_axes = []
         self.annotations["3d"] = []
+        self.note_lookup["3d"] = {}
         self.artists["3d"] = []
         cur_marker = self.marker_style_options[
             self.settings["Marker shape"][0].capitalize()]
@@ -922,7 +1069,11 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
             self.current_3d_axes.append(self.fig_3d.add_subplot(1,
                 len(self.selected_matrices), index+1, projection='3d'))
 
-            score_matrix0 = np.nan_to_num(np.array(cur_matrix))
+            # Changing the dtype copies the matrix; otherwise, nan_to_num
+            # copies it, leaving the data set's matrix as is
+            score_matrix0 = np.asarray(cur_matrix, dtype=self.mds_dtype)
+            score_matrix0 = np.nan_to_num(score_matrix0,
+                                          copy=score_matrix0 is cur_matrix)
             score_matrix = np.maximum(score_matrix0, score_matrix0.T)
 
             mds3 = MDS(3, dissimilarity='precomputed')
@@ -937,37 +1088,29 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
                     grouping_name = split_name[0] + " " + matrix_name
                     grouping_name += " " + " ".join(split_name[-2:])
 
-                # Adds IDs as annotations
-                self.annotations["3d"].append({})
-                self.artists["3d"].append({})
-                grouping = self.data_set.groupings[grouping_name]
-                for group in grouping:
-
-                    x_coords = []
-                    y_coords = []
-                    z_coords = []
-                    group_annotations = []
-                    for cur_id in grouping[group]:
-                        cur_index = self.data_set.index_from_id(cur_id)
-                        x_coords.append(x[cur_index])
-                        y_coords.append(y[cur_index])
-                        z_coords.append(z[cur_index])
-
-                        note = self.current_3d_axes[index].text(x[cur_index],
-                            y[cur_index], z[cur_index], cur_id)
-                        note.set_visible(False)
-                        group_annotations.append(note)
+                # Plots all groups as one collection, colored by group
+                point_indices, point_colors = self.group_point_indices(
+                    grouping_name)
+                cur_artist = self.current_3d_axes[index].scatter(
+                    x[point_indices], y[point_indices], z[point_indices],
+                    c=point_colors, marker=cur_marker, picker=10)
+                self.artists["3d"].append(cur_artist)
 
-                    self.annotations[
-                        "3d"][index][group] = group_annotations
-                    cur_artist, = plt.plot(x_coords, y_coords, z_coords,
-                                           marker=cur_marker, ls="", picker=10)
-                    self.artists["3d"][index][group] = cur_artist
+                # Adds IDs as annotations (in the same order as the points)
+                self.annotations["3d"].append([])
+                for cur_index in point_indices:
+                    note = self.current_3d_axes[index].text(x[cur_index],
+                        y[cur_index], z[cur_index],
+                        self.data_set.records[cur_index].id)
+                    note.set_visible(False)
+                    self.annotations["3d"][index].append(note)
+                    self.note_lookup["3d"].setdefault(
+                        self.data_set.records[cur_index].id, []).append(note)
 
             else:
                 # Adds IDs as annotations
-                cur_artist, = plt.plot(x, y, z, marker=cur_marker, ls="",
-                                       picker=10)
+                cur_artist, = self.current_3d_axes[index].plot(
+                    x, y, z, marker=cur_marker, ls="", picker=10)
                 self.artists["3d"].append(cur_artist)
 
                 self.annotations["3d"].append([])
@@ -980,12 +1123,14 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
                     self.annotations["3d"][index].append(note)
 
         color_axes = [.68, .01, .31, .051]
-        self.color_button = Button(plt.axes(color_axes), "Color by Grouping")
+        self.color_button = Button(self.fig_3d.add_axes(color_axes),
+                                   "Color by Grouping")
         self.color_button.on_clicked(partial(self.color_by_grouping, "3d"))
 
-        self.fig_3d.canvas.mpl_connect("motion_notify_event",
-                                       partial(self.plot_hover, "3d"))
-        self.fig_3d.canvas.mpl_connect('pick_event', self.plot_pick)
+        if new_figure:
+            self.fig_3d.canvas.mpl_connect("motion_notify_event", partial(
+                self.throttle_hover, partial(self.plot_hover, "3d")))
+            self.fig_3d.canvas.mpl_connect('pick_event', self.plot_pick)
 
         plt.show()
 
@@ -1039,6 +1184,40 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
                 self.heat_map()
 
 
+    def group_point_indices(self, grouping_name):
+        """Returns the record indices and colors of the IDs in a grouping.
+
+        The indices are ordered group by group, so that the points of a
+        grouping can be plotted as a single collection. Each group gets the
+        next color in matplotlib's default color cycle.
+
+        Parameters
+        ----------
+        grouping_name : str
+            The name of the grouping in `data_set.groupings`.
+
+        Returns
+        -------
+        point_indices : numpy.ndarray of int
+            The index in `data_set.records` of each ID in the grouping.
+        point_colors : list of str
+            The color of the group that each ID belongs to.
+        """
+
+        cycle_colors = mpl.rcParams["axes.prop_cycle"].by_key()["color"]
+        grouping = self.data_set.groupings[grouping_name]
+
+        point_indices = []
+        point_colors = []
+        for group_index, group in enumerate(grouping):
+            group_color = cycle_colors[group_index % len(cycle_colors)]
+            for cur_id in grouping[group]:
+                point_indices.append(self.data_set.index_from_id(cur_id))
+                point_colors.append(group_color)
+
+        return np.array(point_indices, dtype=int), point_colors
+
+
 ###############################################################################
 # Score visualization methods
 
@@ -1117,7 +1296,14 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         buttons_layout.addStretch(2)
         info_layout.addLayout(buttons_layout, 0, 0)
 
-        font = qtgui.QFont()
+        bw_font = qtgui.QFont()
+        bw_font.setPointSize(10)
+        title_font = qtgui.QFont()
+        title_font.setPointSize(10)
+        title_font.setBold(True)
+        score_font = qtgui.QFont()
+        score_font.setPointSize(9)
+
         self.stats_tables = []
         self.stats_labels = []
         self.bw_labels = []
@@ -1130,9 +1316,8 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
             new_bw_slider.setVisible(False)
             self.bw_sliders.append(new_bw_slider)
 
-            font.setPointSize(10)
             new_bw_label = self.gb.make_widget(qtw.QLabel(
-                "Bandwidth: " + matrix), font=font)
+                "Bandwidth: " + matrix), font=bw_font)
             new_bw_label.setVisible(False)
             self.bw_labels.append(new_bw_label)
 
@@ -1140,29 +1325,24 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
             info_layout.addWidget(new_bw_slider, 2, matrix_index)
 
             # Adds rank table
-            font.setBold(True)
             info_layout.addWidget(self.gb.make_widget(qtw.QLabel(
-                "Rank Table: " + matrix), font=font), 3, matrix_index)
-
-            stats_table = qtw.QTableWidget()
-            stats_table.setRowCount(4)
-            stats_table.setColumnCount(3)
-            hlabels = ["Left (lower)", "Right (higher)", "Total"]
-            stats_table.setHorizontalHeaderLabels(hlabels)
-            vert_text = ("Known Matches: Quantity;Known Non-Matches: Quantity;"
-                         "Known Matches: Percent;Known Non-Matches: Percent")
-            stats_table.setVerticalHeaderLabels(vert_text.split(";"))
-
-            font.setBold(False)
-            font.setPointSize(9)
-            stats_label = self.gb.make_widget(qtw.QLabel("Score:"), font=font)
+                "Rank Table: " + matrix), font=title_font), 3, matrix_index)
+
+            stats_table = self.make_rank_table()
+
+            stats_label = self.gb.make_widget(qtw.QLabel("Score:"),
+                                              font=score_font)
             self.stats_labels.append(stats_label)
             info_layout.addWidget(stats_label, 4, matrix_index)
             self.stats_tables.append(stats_table)
             info_layout.addWidget(stats_table, 5, matrix_index)
 
 
-        self.mv_canvas.mpl_connect("motion_notify_event", self.mv_hover)
+        self.mv_background = None
+        self.mv_note_state = None
+        self.mv_canvas.mpl_connect("draw_event", self.cache_mv_background)
+        self.mv_canvas.mpl_connect("motion_notify_event", partial(
+            self.throttle_hover, self.mv_hover, debounce=True))
         self.mv_canvas.mpl_connect('button_press_event', self.mv_click)
         self.mv_canvas.mpl_connect('pick_event', self.mv_pick)
 
@@ -1180,6 +1360,37 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
             self.interpolation_scores = []
 
 
+    def make_rank_table(self):
+        """Creates an empty rank table for a match visualization.
+
+        The rows hold the number and percent of known matches and non-matches
+        to the left and right of a score. Every cell holds an item, whose
+        text is set when hovering over the plot.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        stats_table : QTableWidget
+            The labeled, empty rank table.
+        """
+
+        stats_table = qtw.QTableWidget()
+        stats_table.setRowCount(len(RANK_TABLE_VLABELS))
+        stats_table.setColumnCount(len(RANK_TABLE_HLABELS))
+        stats_table.setHorizontalHeaderLabels(RANK_TABLE_HLABELS)
+        stats_table.setVerticalHeaderLabels(RANK_TABLE_VLABELS)
+
+        # Hovering changes the items' text rather than replacing the items
+        for rownum in range(len(RANK_TABLE_VLABELS)):
+            for colnum in range(len(RANK_TABLE_HLABELS)):
+                stats_table.setItem(rownum, colnum, qtw.QTableWidgetItem(""))
+
+        return stats_table
+
+
     def histogram(self):
         """Displays a histogram of the data.
 
@@ -1218,28 +1429,31 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
                 1, len(self.selected_matrices), matrix_index+1)
 
             mnm_scores = self.data_set.match_nonmatch_scores[matrix_name]
-            match_scores = [row[0] for row in mnm_scores["matches"]]
-            nonmatch_scores = [row[0] for row in mnm_scores["nonmatches"]]
-            all_scores = [row[0] for row in mnm_scores["all"]]
+            match_scores = mnm_scores["match scores"]
+            nonmatch_scores = mnm_scores["nonmatch scores"]
 
+            # Bins matches and non-matches on the same edges
             bin_size = int(math.sqrt(len(match_scores) + len(nonmatch_scores)))
-            nonmatch_weights = np.zeros_like(nonmatch_scores)
-            nonmatch_weights += 1. / len(nonmatch_scores)
-            match_weights = np.zeros_like(match_scores) + 1./len(match_scores)
+            bins = np.linspace(mnm_scores["min score"],
+                               mnm_scores["max score"], bin_size+1)
+            bin_widths = np.diff(bins)
+            match_counts, _ = np.histogram(match_scores, bins=bins)
+            nonmatch_counts, _ = np.histogram(nonmatch_scores, bins=bins)
 
             axis = self.current_axes[matrix_index]
 
-            axis.hist(nonmatch_scores, bin_size, alpha=.5,
-                      weights=nonmatch_weights, label="Unmatched Scores",
-                      color="red")
-            axis.hist(match_scores, bin_size, alpha=.5, weights=match_weights,
-                         label="Matched Scores", color="blue")
+            axis.bar(bins[:-1], nonmatch_counts / len(nonmatch_scores),
+                     width=bin_widths, align="edge", alpha=.5,
+                     label="Unmatched Scores", color="red")
+            axis.bar(bins[:-1], match_counts / len(match_scores),
+                     width=bin_widths, align="edge", alpha=.5,
+                     label="Matched Scores", color="blue")
 
             axis.legend(loc='upper right')
             axis.set_title(matrix_name)
             axis.set_xlabel("Score")
             axis.set_ylabel("Relative Frequency")
-            axis.set_xlim(min(all_scores), max(all_scores))
+            axis.set_xlim(bins[0], bins[-1])
 
 
         self.cursor = MultiCursor(self.current_axes[0].get_figure().canvas,
@@ -1289,29 +1503,31 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
             self.mv_figure.suptitle("Data Histogram", fontsize=18)
 
         self.cur_points =[]
+        self.smooth_xs = []
         for matrix_index, matrix_name in enumerate(self.selected_matrices):
 
             mnm_scores = self.data_set.match_nonmatch_scores[matrix_name]
-            match_scores = [row[0] for row in mnm_scores["matches"]]
-            nonmatch_scores = [row[0] for row in mnm_scores["nonmatches"]]
-            all_scores = [row[0] for row in mnm_scores["all"]]
-            max_score = max(all_scores)
+            match_scores = mnm_scores["match scores"]
+            nonmatch_scores = mnm_scores["nonmatch scores"]
+            max_score = mnm_scores["max score"]
 
             x = np.linspace(0, max_score, 200)
+            self.smooth_xs.append(x)
 
             if bandwidth:
                 self.current_axes[matrix_index].clear()
-                gkde_match = stats.gaussian_kde(match_scores, bandwidth)
-                gkde_nonmatch = stats.gaussian_kde(nonmatch_scores, bandwidth)
+                match_heights = self.kde_heights(match_scores, x, bandwidth)
+                nonmatch_heights = self.kde_heights(nonmatch_scores, x,
+                                                    bandwidth)
             else:
                 self.current_axes[matrix_index] = self.mv_figure.add_subplot(
                     1, len(self.selected_matrices), matrix_index+1)
-                gkde_match = stats.gaussian_kde(match_scores)
-                gkde_nonmatch = stats.gaussian_kde(nonmatch_scores)
-                self.bandwidth_init = gkde_match.covariance_factor()
+                match_heights = self.kde_heights(match_scores, x)
+                nonmatch_heights = self.kde_heights(nonmatch_scores, x)
 
-                # Adds bandwidth slider
-                cur_bw = gkde_match.covariance_factor()
+                # Adds bandwidth slider (Scott's factor, the default)
+                cur_bw = len(match_scores)**(-1./5)
+                self.bandwidth_init = cur_bw
                 self.bw_sliders[matrix_index].setMinimum(1)
                 self.bw_sliders[matrix_index].setMaximum(int(400*cur_bw))
                 self.bw_sliders[matrix_index].setValue(int(100*cur_bw))
@@ -1325,11 +1541,12 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
                     "Bandwidth: " + str(format(cur_bw, '.4g')))
                 self.bw_labels[matrix_index].setVisible(True)
 
-            total = len(all_scores)
+            total = len(mnm_scores["all scores"])
 
-            matches_relative = [point/total for point in gkde_match(x)]
-            nonmatches_relative = [point2/total for point2 in gkde_nonmatch(x)]
-            self.cur_points.append([matches_relative, nonmatches_relative])
+            matches_relative = match_heights / total
+            nonmatches_relative = nonmatch_heights / total
+            self.cur_points.append(
+                np.vstack((matches_relative, nonmatches_relative)))
 
             # Adds separate labels
             # (fill_between labels don't work before mpl 1.5.0)
@@ -1342,7 +1559,7 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
                               alpha=.5, label='Non-Match')
             axis.set_xlim(0, max_score)
 
-            max_y = 1.1*max([max(matches_relative), max(nonmatches_relative)])
+            max_y = 1.1*max(matches_relative.max(), nonmatches_relative.max())
             axis.set_ylim(0, max_y)
 
             axis.legend(loc='upper right')
@@ -1353,8 +1570,8 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         self.cursor = self.CustomCursor(
             self.current_axes[0].get_figure().canvas, self.current_axes,
             useblit=True, horizOn=True, points=self.cur_points,
-            mnm=self.data_set.match_nonmatch_scores, selected_matrices =
-            self.selected_matrices, linewidth=1, ls="--", color='black')
+            xs=self.smooth_xs, selected_matrices=self.selected_matrices,
+            linewidth=1, ls="--", color='black')
 
         self.mv_plot_type = "smooth histogram"
         width = min(self.screen_geometry.width(),
@@ -1394,20 +1611,16 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         matrix_name = self.current_axes[matrix_index].get_title()
 
         mnm_scores = self.data_set.match_nonmatch_scores[matrix_name]
-        match_scores = [row[0] for row in mnm_scores["matches"]]
-        nonmatch_scores = [row[0] for row in mnm_scores["nonmatches"]]
-        all_scores = [row[0] for row in mnm_scores["all"]]
-        max_score = max(all_scores)
-
-        gkde_match = stats.gaussian_kde(match_scores, bandwidth)
-        gkde_nonmatch = stats.gaussian_kde(nonmatch_scores, bandwidth)
+        max_score = mnm_scores["max score"]
+        total = len(mnm_scores["all scores"])
 
-        total = len(all_scores)
-
-        x = np.linspace(0, max_score, 200)
-        matches_relative = [point / total for point in gkde_match(x)]
-        nonmatches_relative = [point2 / total for point2 in gkde_nonmatch(x)]
-        self.cur_points[matrix_index] = [matches_relative, nonmatches_relative]
+        x = self.smooth_xs[matrix_index]
+        matches_relative = self.kde_heights(
+            mnm_scores["match scores"], x, bandwidth) / total
+        nonmatches_relative = self.kde_heights(
+            mnm_scores["nonmatch scores"], x, bandwidth) / total
+        self.cur_points[matrix_index] = np.vstack((matches_relative,
+                                                   nonmatches_relative))
 
         # Draws the new histograms
         axis = self.current_axes[matrix_index]
@@ -1425,7 +1638,7 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         axis.set_title(matrix_name)
         axis.set_xlabel("Score")
         axis.set_ylabel("Relative Frequency")
-        axis.get_figure().canvas.draw()
+        axis.get_figure().canvas.draw_idle()
         self.bw_labels[matrix_index].setText(
             "Bandwidth: " + str(format(bandwidth, '.4g')))
 
@@ -1433,6 +1646,171 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
             self.mv_click(prev_score=score)
 
 
+    def kde_heights(self, scores, x, bandwidth=None):
+        """Evaluates a Gaussian kernel density estimate of scores at `x`.
+
+        Uses scipy.stats.gaussian_kde for small score sets. For more than
+        `FFT_KDE_MIN_SCORES` scores, bins the scores on a fine grid and
+        convolves the counts with the Gaussian kernel using an FFT, which
+        takes O(n + m log m) time rather than O(n * len(x)).
+
+        Parameters
+        ----------
+        scores : numpy.ndarray
+            The scores to estimate the density of.
+        x : numpy.ndarray
+            The increasing points at which to evaluate the density.
+        bandwidth : float, optional
+            The kernel bandwidth as a factor of the scores' standard
+            deviation, as in scipy.stats.gaussian_kde. Defaults to Scott's
+            factor.
+
+        Returns
+        -------
+        heights : numpy.ndarray
+            The estimated density at each point of `x`.
+
+        See Also
+        --------
+        smooth_histogram: Displays the smoothed histograms.
+        scipy.stats.gaussian_kde: The KDE used for small score sets.
+        """
+
+        if bandwidth is None:
+            bandwidth = len(scores)**(-1./5)
+
+        if len(scores) <= FFT_KDE_MIN_SCORES:
+            return stats.gaussian_kde(scores, bandwidth)(x)
+
+        # Bins the scores on a grid that also covers the kernel's tails
+        sigma = bandwidth * np.std(scores, ddof=1)
+        grid_min = min(scores.min(), x[0]) - 4*sigma
+        grid_max = max(scores.max(), x[-1]) + 4*sigma
+        edges = np.linspace(grid_min, grid_max, FFT_KDE_GRID_SIZE + 1)
+        counts, _ = np.histogram(scores, bins=edges)
+        step = edges[1] - edges[0]
+        centers = edges[:-1] + .5*step
+
+        # Smooths the counts with a Gaussian kernel normalized on the grid
+        half_width = int(math.ceil(4*sigma / step))
+        kernel_x = step * np.arange(-half_width, half_width + 1)
+        kernel = np.exp(-.5 * (kernel_x / sigma)**2)
+        kernel /= kernel.sum() * step
+        density = signal.fftconvolve(counts, kernel, mode="same")
+
+        return np.interp(x, centers, density / len(scores))
+
+
+    def get_roc_curves(self, matrix_names):
+        """Gets the ROC curve of each matrix, computing only missing ones.
+
+        Curves are cached in roc_cache and reused as long as the matrix's
+        scores are the same array; curves that need computing are computed
+        in parallel, one matrix per thread.
+
+        Parameters
+        ----------
+        matrix_names : list of str
+            The names of the matrices to get ROC curves for.
+
+        Returns
+        -------
+        dict of {str : tuple}
+            The (false positive rates, true positive rates, thresholds, AUC)
+            of each matrix.
+
+        See Also
+        --------
+        show_roc_curve: Displays the ROC curve.
+        """
+
+        def compute_roc(gt, flat_scores):
+            false_pos_rate, true_pos_rate, thresholds = self.binary_roc_curve(
+                gt, flat_scores)
+            roc_auc = auc(false_pos_rate, true_pos_rate)
+            return false_pos_rate, true_pos_rate, thresholds, roc_auc
+
+        missing = {}
+        for matrix_name in matrix_names:
+            mnm_scores = self.data_set.match_nonmatch_scores[matrix_name]
+            cached = self.roc_cache.get(matrix_name)
+            if cached is None or cached[0] is not mnm_scores["all scores"]:
+                missing[matrix_name] = mnm_scores
+
+        if len(missing) > 0:
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                futures = {matrix_name: executor.submit(
+                               compute_roc, mnm_scores["gt array"],
+                               mnm_scores["all scores"])
+                           for matrix_name, mnm_scores in missing.items()}
+            for matrix_name, future in futures.items():
+                self.roc_cache[matrix_name] = (
+                    missing[matrix_name]["all scores"],) + future.result()
+
+        return {matrix_name: self.roc_cache[matrix_name][1:]
+                for matrix_name in matrix_names}
+
+
+    def binary_roc_curve(self, gt, scores):
+        """Computes an ROC curve from binary ground truth values and scores.
+
+        Gives the same curve as sklearn's `roc_curve` (with intermediate
+        points dropped) for ground truth values of 0 and 1, without its input
+        validation: one sort, then cumulative true and false positive counts
+        taken at each distinct score.
+
+        Parameters
+        ----------
+        gt : list of int or numpy.ndarray
+            The ground truth value of each score (1 for the positive class).
+        scores : numpy.ndarray
+            The scores.
+
+        Returns
+        -------
+        false_pos_rate : numpy.ndarray
+            The false positive rate at each threshold.
+        true_pos_rate : numpy.ndarray
+            The true positive rate at each threshold.
+        thresholds : numpy.ndarray
+            The decreasing thresholds, starting at infinity.
+
+        See Also
+        --------
+        get_roc_curves: Gets the ROC curve of each matrix.
+        """
+
+        order = np.argsort(scores, kind="mergesort")[::-1]
+        sorted_scores = np.asarray(scores)[order]
+        sorted_gt = np.asarray(gt)[order]
+
+        # Last position of each distinct score
+        threshold_indices = np.r_[np.flatnonzero(np.diff(sorted_scores)),
+                                  sorted_gt.size - 1]
+        true_pos = np.cumsum(sorted_gt)[threshold_indices]
+        false_pos = 1 + threshold_indices - true_pos
+        thresholds = sorted_scores[threshold_indices]
+
+        # Drops points that lie on a straight line between their neighbors
+        if len(false_pos) > 2:
+            keep = np.flatnonzero(np.r_[
+                True, np.logical_or(np.diff(false_pos, 2),
+                                    np.diff(true_pos, 2)), True])
+            false_pos = false_pos[keep]
+            true_pos = true_pos[keep]
+            thresholds = thresholds[keep]
+
+        true_pos = np.r_[0, true_pos]
+        false_pos = np.r_[0, false_pos]
+        thresholds = np.r_[np.inf, thresholds]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            false_pos_rate = false_pos / false_pos[-1]
+            true_pos_rate = true_pos / true_pos[-1]
+
+        return false_pos_rate, true_pos_rate, thresholds
+
+
     def show_roc_curve(self, plotting_change=False):
         """Creates ROC curves for the score matrices.
 
@@ -1473,12 +1851,59 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         if len(self.selected_matrices) > 1:
             self.one_plot_button.setVisible(True)
 
+        self.plot_roc_curves(plotting_change)
+
+        width = min(self.screen_geometry.width(),
+                    600*len(self.selected_matrices))
+        self.mv_widget.setGeometry(40, 70, width, 1000)
+        self.mv_hover()
+        self.mv_widget.show()
+
+
+    def plot_roc_curves(self, plotting_change=False):
+        """Plots the ROC curves of the selected matrices on the open figure.
+
+        Clears the match visualization figure and lays the curves out on one
+        plot or on separate plots, depending on `use_1_plot`. The widget
+        itself is kept, so this is also used to switch layouts.
+
+        Parameters
+        ----------
+        plotting_change : {False, True}
+            Determines whether or not the number of plots was changed (if so,
+            redraws interpolation scores)
+
+        Returns
+        -------
+        None
+
+        See Also
+        --------
+        show_roc_curve: Displays the ROC curve.
+        roc_plotting_change: Switches between showing the ROC curves on one
+            plot or separate plots.
+        """
+
+        self.mv_figure.clear()
+        self.mv_background = None
+        self.cur_mv_note = None
+        self.mv_shown_notes = []
+
         num_plots = len(self.selected_matrices)
-        self.current_axes = [None for axis in range(num_plots)]
         if self.use_1_plot:
             num_plots = 1
-            self.current_axes = [None]
-            self.current_axes[0] = self.mv_figure.add_subplot(1, 1, 1)
+
+        # Configures the axes once, with autoscaling off while curves are added
+        self.current_axes = []
+        for axis_index in range(num_plots):
+            axis = self.mv_figure.add_subplot(1, num_plots, axis_index+1)
+            axis.set(xlim=(-.01, 1.01), ylim=(-.01, 1.01),
+                     xlabel='False Positive Rate',
+                     ylabel='True Positive Rate')
+            axis.set_autoscale_on(False)
+            if not self.use_1_plot:
+                axis.set_title(self.selected_matrices[axis_index])
+            self.current_axes.append(axis)
 
         self.mv_figure.suptitle("Receiver Operating Characteristic Curve",
                                 fontsize=18)
@@ -1489,15 +1914,12 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         self.artists["mv"] = []
         self.annotations["mv"] = []
         self.selectors = []
+        roc_curves = self.get_roc_curves(self.selected_matrices)
         for matrix_index, matrix_name in enumerate(self.selected_matrices):
 
             # Gets ROC from expected and actual scores
-            mnm_scores = self.data_set.match_nonmatch_scores[matrix_name]
-            flat_scores = [row[0] for row in mnm_scores["all"]]
-            gt = mnm_scores["gt"]
-            false_pos_rate, true_pos_rate, thresholds = roc_curve(
-                gt, flat_scores)
-            roc_auc = auc(false_pos_rate, true_pos_rate)
+            false_pos_rate, true_pos_rate, thresholds, roc_auc = roc_curves[
+                matrix_name]
 
             # Creates plots
             plot_label = "AUC = %0.3f" % roc_auc
@@ -1506,10 +1928,7 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
                 plot_label = matrix_name + "\n" + plot_label
 
             else:
-                self.current_axes[matrix_index] = self.mv_figure.add_subplot(
-                    1, len(self.selected_matrices), matrix_index+1)
                 axis = self.current_axes[matrix_index]
-                axis.set_title(matrix_name)
 
             # Adjusts marker settings
             cur_color = list(self.color_options.keys())[
@@ -1521,34 +1940,20 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
                 markersize=4, label=plot_label, picker=10)
             self.artists["mv"].append(cur_artist)
 
-            # Adds annotations
-            matrix_notes = []
-            for index, threshold in enumerate(thresholds):
-                note = axis.annotate(
-                        threshold,
-                        xy=(false_pos_rate[index], true_pos_rate[index]),
-                        xytext=(false_pos_rate[index] + .02,
-                                true_pos_rate[index] + .02),
-                        arrowprops=dict(arrowstyle='->'),
-                        bbox=dict(boxstyle="round", fc="w"))
-                note.set_visible(False)
-                matrix_notes.append(note)
-            self.annotations["mv"].append(matrix_notes)
-
-            # Adjusts axes
-            axis.legend(loc='lower right')
-            axis.plot([0,1], [0,1], 'r--')
-            axis.set_xlim( [-.01, 1.01] )
-            axis.set_ylim( [-.01, 1.01] )
-            axis.set_ylabel('True Positive Rate')
-            axis.set_xlabel('False Positive Rate')
-
+            # Annotation is created on first hover (see get_mv_note)
+            self.annotations["mv"].append(None)
 
             self.thresholds.append(thresholds)
-            self.cur_points.append([false_pos_rate, true_pos_rate])
+            self.cur_points.append(
+                np.column_stack((false_pos_rate, true_pos_rate)).T)
             self.selectors.append(
                 RectangleSelector(axis, partial(self.plot_rect, matrix_index)))
 
+        # Adds the chance line and legend once all curves are plotted
+        for axis in self.current_axes:
+            axis.plot([0,1], [0,1], 'r--')
+            axis.legend(loc='lower right')
+
         # If necessary, redraws interpolation scores
         if plotting_change:
             for cur_score in self.interpolation_scores:
@@ -1559,12 +1964,6 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
                                   useblit=True, linewidth=1,
                                   ls="--", color='black')
 
-        width = min(self.screen_geometry.width(),
-                    600*len(self.selected_matrices))
-        self.mv_widget.setGeometry(40, 70, width, 1000)
-        self.mv_hover()
-        self.mv_widget.show()
-
 
     def roc_plotting_change(self, label):
         """Switches between showing ROC curves on one plot or separate plots.
@@ -1586,11 +1985,14 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         label = str(self.one_plot_button.text())
         if label == "Show on Single Plot":
             self.use_1_plot = True
+            self.one_plot_button.setText("Show on Separate Plots")
         else:
             self.use_1_plot = False
+            self.one_plot_button.setText("Show on Single Plot")
 
-        plt.close()
-        self.show_roc_curve(True)
+        # Re-lays out the open figure rather than rebuilding the widget
+        self.plot_roc_curves(True)
+        self.mv_canvas.draw_idle()
 
 
     def linear_ordering(self):
@@ -1625,6 +2027,10 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         self.mv_figure.suptitle("Linear Ordering", fontsize=18)
         self.artists["mv"] = []
         self.annotations["mv"] = []
+        self.mv_note_pair = None
+        self.mv_shown_notes = []
+        self.mv_pair_indices = [[] for axis in mtx_range]
+        self.mv_sorted_scores = [[] for axis in mtx_range]
         self.interpolation_scores = []
         style = self.marker_style_options[
             self.settings["Marker shape"][0].capitalize()]
@@ -1634,16 +2040,17 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
                 len(self.selected_matrices), 1, matrix_index+1)
 
             mnm_scores = self.data_set.match_nonmatch_scores[matrix_name]
-            match_scores = [row[0] for row in mnm_scores["matches"]]
-            nonmatch_scores = [row[0] for row in mnm_scores["nonmatches"]]
-            all_scores = [row[0] for row in mnm_scores["all"]]
+            match_scores = mnm_scores["match scores"]
+            nonmatch_scores = mnm_scores["nonmatch scores"]
 
-            match_y = np.array(match_scores)
-            match_y.fill(.005)
-            nonmatch_y = np.array(nonmatch_scores)
-            nonmatch_y.fill(-.03)
+            match_y = np.full(match_scores.shape, .005)
+            nonmatch_y = np.full(nonmatch_scores.shape, -.03)
 
             axis = self.current_axes[matrix_index]
+            axis.set(xlim=(mnm_scores["min score"], mnm_scores["max score"]),
+                     ylim=(-.05, .05), xlabel="Score", title=matrix_name)
+            axis.set_autoscale_on(False)
+            axis.yaxis.set_visible(False)
             axis.axhline(.005)
 
             # Adds artists
@@ -1656,45 +2063,36 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
                       label="Unmatched Scores", markersize=5, picker=8)
             new_artists.append(cur_artist)
             self.artists["mv"].append(new_artists)
-            axis.set_xlim(min(all_scores),
-                          max(all_scores))
-            axis.set_ylim(-.05, .05)
-            axis.yaxis.set_visible(False)
-            axis.set_xlabel("Score")
-            axis.set_title(matrix_name)
             axis.legend(loc='upper right')
 
-            # Adds annotations
-            match_notes = []
-            for index, match_info in enumerate(mnm_scores["matches"]):
-                text = (match_info[1] + " and \n" + match_info[2] + ": \n"
-                        + str(match_info[0]))
-                note = self.current_axes[matrix_index].annotate(text,
-                    xy=(match_info[0], .005),
-                    xytext=(match_info[0]+.005, .011),
-                    arrowprops=dict(arrowstyle='->'), bbox=dict(
-                    boxstyle="round", fc="w"))
-                note.set_visible(False)
-                match_notes.append(note)
-
-            nonmatch_notes = []
-            for index, nonmatch_info in enumerate(mnm_scores["nonmatches"]):
-                text = (nonmatch_info[1] + " and \n" + nonmatch_info[2]
-                        + ": \n" + str(nonmatch_info[0]))
-                note = self.current_axes[matrix_index].annotate(text,
-                    xy=(nonmatch_info[0], -.03),
-                    xytext=(nonmatch_info[0], -.05),
-                    arrowprops=dict(arrowstyle='->'),
-                    bbox=dict(boxstyle="round", fc="w"))
-                note.set_visible(False)
-                nonmatch_notes.append(note)
-
-            self.annotations["mv"].append([match_notes, nonmatch_notes])
+            # Annotations are created on first hover (see get_mv_note)
+            self.annotations["mv"].append([None, None])
+            for line_type in ["matches", "nonmatches"]:
+
+                # Index of each record pair, to find it on the other axes
+                self.mv_pair_indices[matrix_index].append(
+                    {(info[1], info[2]): index for index, info
+                     in enumerate(mnm_scores[line_type])})
+
+                # Sorted scores, to find the hovered point by bisection
+                line_scores = mnm_scores[line_type[:-2] + " scores"]
+                order = np.argsort(line_scores, kind="mergesort")
+                self.mv_sorted_scores[matrix_index].append(
+                    (line_scores[order], order))
 
         # Adjusts plot style
         bottom_height = .2/len(self.selected_matrices)
         self.mv_figure.subplots_adjust(bottom=bottom_height)
 
+        # Draws only distinguishable points, again after zooms and resizes
+        for axis in self.current_axes:
+            self.decimate_linear_ordering(axis)
+            axis.callbacks.connect("xlim_changed",
+                                   self.decimate_linear_ordering)
+        self.mv_canvas.mpl_connect("resize_event", lambda event: [
+            self.decimate_linear_ordering(axis)
+            for axis in self.current_axes])
+
         self.cursor = MultiCursor(self.current_axes[0].get_figure().canvas,
                                   self.current_axes, horizOn=False,
                                   useblit=True, linewidth=1, ls="--",
@@ -1707,6 +2105,51 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         self.mv_widget.show()
 
 
+    def decimate_linear_ordering(self, axis):
+        """Plots only the linear ordering points that can be told apart.
+
+        All points on a line of the linear ordering have the same height, so
+        points within half a pixel of each other are drawn over one another.
+        Using the sorted scores, keeps the points within the axis's x-range
+        and, of those, the first in each half pixel.
+
+        Parameters
+        ----------
+        axis : matplotlib.axes.Axes
+            The linear ordering axis whose x-range changed.
+
+        Returns
+        -------
+        None
+
+        See Also
+        --------
+        linear_ordering: Displays the linear ordering
+        """
+
+        axis_index = self.current_axes.index(axis)
+        x_min, x_max = axis.get_xlim()
+        if not x_max > x_min:
+            return
+
+        scale = 2 * axis.bbox.width / (x_max - x_min)
+        for line_index, artist in enumerate(self.artists["mv"][axis_index]):
+            sorted_scores = self.mv_sorted_scores[axis_index][line_index][0]
+
+            # Keeps markers that are partly inside the axis
+            margin = 2 * artist.get_markersize() * axis.figure.dpi / 72.
+            start, stop = np.searchsorted(sorted_scores, [
+                x_min - margin/scale, x_max + margin/scale])
+
+            visible = sorted_scores[start:stop]
+            columns = np.floor((visible - x_min) * scale)
+            keep = np.ones(len(visible), dtype=bool)
+            keep[1:] = columns[1:] != columns[:-1]
+
+            artist.set_data(visible[keep],
+                            np.full(keep.sum(), [.005, -.03][line_index]))
+
+
     def show_stats(self):
         """ Displays the mean, median, and standard deviation for each matrix.
 
@@ -1722,12 +2165,10 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         info_text = ""
         for matrix_name in self.data_set.matrices:
             cur_matrix = self.data_set.matrices[matrix_name]["matrix"]
-            cur_matrix.flatten()
-            cur_matrix=cur_matrix[~np.isnan(cur_matrix)]
 
             m_type = self.data_set.matrices[matrix_name]["type"].lower()
-            info = (m_type, np.average(cur_matrix), m_type,
-                    np.median(cur_matrix), np.std(cur_matrix))
+            info = (m_type, np.nanmean(cur_matrix), m_type,
+                    np.nanmedian(cur_matrix), np.nanstd(cur_matrix))
 
             info_text += (matrix_name + ": \n\n" + ("  Mean %s: %s \n "
                 " Median %s: %s \n  Standard deviation: %s" %info)
@@ -1755,15 +2196,17 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
 
         """
 
-        score, ok = qtw.QInputDialog.getText(self, 'Score Interpolation',
-                                             'Enter score:')
-        if not ok:
-            return False
-        try:
-            score = float(score)
-        except ValueError:
-            self.gb.general_msgbox("Error", "Please enter a number.")
-            return self.get_interpolation_score()
+        # Asks again until the user enters a number or cancels
+        while True:
+            score, ok = qtw.QInputDialog.getText(self, 'Score Interpolation',
+                                                 'Enter score:')
+            if not ok:
+                return False
+            try:
+                score = float(score)
+                break
+            except ValueError:
+                self.gb.general_msgbox("Error", "Please enter a number.")
 
         self.interpolation_scores.append(score)
         return score
@@ -1797,107 +2240,191 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         if self.options_widget:
             self.options_widget.close()
 
-        # Sets up the figure and canvas
-        self.cluster_widget = qtw.QWidget()
-        self.cluster_widget.setWindowTitle("Clustering")
-        self.cluster_widget.setWindowIcon(self.data_set.icon)
-
-        vbox = qtw.QVBoxLayout(self.cluster_widget)
-        cluster_scroll = qtw.QScrollArea(self.cluster_widget)
-        cluster_scroll.setWidgetResizable(True)
-        cluster_scroll_container = qtw.QWidget()
-        cluster_scroll.setWidget(cluster_scroll_container)
-        container_layout = qtw.QVBoxLayout()
-        cluster_scroll_container.setLayout(container_layout)
-
-        self.cluster_figure = mpl.figure.Figure()
-        self.cluster_canvas = FigureCanvas(self.cluster_figure)
-        self.cluster_canvas.setParent(self.cluster_widget)
-        self.cluster_canvas.setFocusPolicy(qtcore.Qt.StrongFocus)
-        self.cluster_canvas.setFocus()
-        self.cluster_canvas.setSizePolicy(qtw.QSizePolicy.Preferred,
-                                          qtw.QSizePolicy.Preferred)
+        # Reuses the window, figure, and canvas of earlier clusterings
+        if self.cluster_widget is None:
+            self.create_cluster_widget()
+        else:
+            self.cluster_figure.clear()
 
-        self.mpl_toolbar = NavigationToolbar(self.cluster_canvas,
-                                             cluster_scroll_container)
+        for cid in self.cluster_cids:
+            self.cluster_canvas.mpl_disconnect(cid)
 
         # Calculates and stores clusters for current clustering method
         self.labels = None
-        self.cur_points = []
+        self.cluster_points = []
         self.cluster_methods[str(self.cluster_method)]()
 
-        # Adds widget for buttons and labels below figure
-        self.info_widget = qtw.QWidget(cluster_scroll_container)
-        info_layout = qtw.QGridLayout()
+        info_layout = self.info_widget.layout()
+        clustered = self.labels is not None
+        for widget in [self.cluster_title, self.lasso_rect_widget,
+                       self.view_all_btn]:
+            widget.setVisible(clustered)
 
         widget_index = 1
-
-        buttons_layout = qtw.QHBoxLayout()
-        buttons_layout.addWidget(self.gb.make_widget(qtw.QPushButton(
-            " Clustering Preferences "), "clicked", self.cluster_options))
-
-        if self.labels is not None:
-
-            self.lasso_btn = self.gb.make_widget(qtw.QPushButton(
-                "Lasso Select"), "clicked",
-                partial(self.cluster_selector_change, "cluster", rect=False))
-            self.rect_btn = self.gb.make_widget(qtw.QPushButton(
-                "Rectangle Select"), "clicked",
-                partial(self.cluster_selector_change, "cluster", rect=True))
-            self.rect_btn.setDefault(True)
-
-            font = qtgui.QFont()
-            font.setPointSize(11)
-            font.setBold(True)
-
-            buttons_layout.addWidget(self.gb.make_widget(qtw.QPushButton(
-                "View Records in All Clusters"), "clicked",
-                self.view_clusters))
-            info_layout.addWidget(self.gb.make_widget(qtw.QLabel("Clusters"),
-                                  font=font), 0, 0)
-            lasso_rect_layout = qtw.QHBoxLayout()
-            lasso_rect_layout.addStretch(2)
-            lasso_rect_layout.addWidget(self.lasso_btn)
-            lasso_rect_layout.addWidget(self.rect_btn)
-            info_layout.addLayout(lasso_rect_layout, 0, 1, 1, 2)
-            font.setPointSize(9)
+        row_index = 0
+        if clustered:
+            self.rect_btn.setDefault(True)
+            self.lasso_btn.setDefault(False)
 
             # For each matrix, lists items in each cluster, if possible.
             for index, matrix_name in enumerate(self.selected_matrices):
-                info_layout.addWidget(self.gb.make_widget(qtw.QLabel(
-                    "Clusters for " + matrix_name + ":"), font=font),
-                    widget_index, 0, 1, 2)
+                if index == len(self.cluster_matrix_labels):
+                    self.cluster_matrix_labels.append(self.gb.make_widget(
+                        qtw.QLabel(), font=self.cluster_matrix_font))
+
+                matrix_label = self.cluster_matrix_labels[index]
+                matrix_label.setText("Clusters for " + matrix_name + ":")
+                matrix_label.setVisible(True)
+                info_layout.addWidget(matrix_label, widget_index, 0, 1, 2)
                 widget_index += 1
 
                 # Displays lists of items in each cluster
                 keys=list(self.clusters[matrix_name].keys())
                 keys.sort()
                 for label in keys:
-                    cur_label = qtw.QLabel("Cluster " + str(label+1) + ": ")
-                    cur_edit = qtw.QLineEdit(", ".join(
+                    if row_index == len(self.cluster_rows):
+                        cur_edit = qtw.QLineEdit()
+                        cur_edit.setReadOnly(True)
+                        self.cluster_rows.append((qtw.QLabel(), cur_edit,
+                                                  qtw.QPushButton("View")))
+
+                    cur_label, cur_edit, view_btn = self.cluster_rows[
+                        row_index]
+                    cur_label.setText("Cluster " + str(label+1) + ": ")
+                    cur_edit.setText(", ".join(
                         self.clusters[matrix_name][label]))
-                    cur_edit.setReadOnly(True)
-                    info_layout.addWidget(cur_label, widget_index, 0)
-                    info_layout.addWidget(cur_edit, widget_index, 1)
+                    if view_btn.receivers(view_btn.clicked) > 0:
+                        view_btn.clicked.disconnect()
+                    view_btn.clicked.connect(partial(
+                        self.view_clusters, matrix_name, label))
 
-                    info_layout.addWidget(self.gb.make_widget(qtw.QPushButton(
-                        "View"), "clicked", partial(self.view_clusters,
-                        matrix_name, label)), widget_index, 2)
+                    for column, widget in enumerate(self.cluster_rows[
+                        row_index]):
+                        widget.setVisible(True)
+                        info_layout.addWidget(widget, widget_index, column)
 
                     widget_index += 1
-
-            self.cluster_canvas.mpl_connect(
-                "motion_notify_event", partial(self.plot_hover, "cluster"))
-            self.cluster_canvas.mpl_connect('pick_event', self.plot_pick)
+                    row_index += 1
+
+            self.cluster_cids = [
+                self.cluster_canvas.mpl_connect(
+                    "motion_notify_event", partial(
+                        self.throttle_hover, partial(self.plot_hover,
+                                                     "cluster"))),
+                self.cluster_canvas.mpl_connect('pick_event',
+                                                self.plot_pick),
+                self.cluster_canvas.mpl_connect("motion_notify_event",
+                                                self.move_cluster_selector)]
 
         else:
-            self.cluster_canvas.mpl_connect("motion_notify_event",
-                                            self.hier_hover)
-            self.cluster_canvas.mpl_connect('pick_event', self.hier_pick)
+            self.cluster_cids = [
+                self.cluster_canvas.mpl_connect("motion_notify_event",
+                    partial(self.throttle_hover, self.hier_hover)),
+                self.cluster_canvas.mpl_connect('pick_event',
+                                                self.hier_pick)]
+
+        # Hides widgets left over from clusterings with more clusters
+        matrices_shown = len(self.selected_matrices) if clustered else 0
+        for matrix_label in self.cluster_matrix_labels[matrices_shown:]:
+            matrix_label.setVisible(False)
+        for row in self.cluster_rows[row_index:]:
+            for widget in row:
+                widget.setVisible(False)
+
+        info_layout.addWidget(self.cluster_buttons, widget_index+1, 1)
+        self.cluster_canvas.draw_idle()
+        self.cluster_widget.show()
 
-        info_layout.addLayout(buttons_layout, widget_index+1, 1)
-        self.info_widget.setLayout(info_layout)
 
+    def create_cluster_widget(self):
+        """Creates the window on which clusterings are displayed.
+
+        The window, figure, canvas, and buttons are created once and reused
+        by every later clustering; `cluster` fills in the figure and the
+        lists of clusters.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        See Also
+        --------
+        cluster: Plots the results of the chosen clustering method.
+        """
+
+        # Sets up the figure and canvas
+        self.cluster_widget = qtw.QWidget()
+        self.cluster_widget.setWindowTitle("Clustering")
+        self.cluster_widget.setWindowIcon(self.data_set.icon)
+
+        vbox = qtw.QVBoxLayout(self.cluster_widget)
+        cluster_scroll = qtw.QScrollArea(self.cluster_widget)
+        cluster_scroll.setWidgetResizable(True)
+        cluster_scroll_container = qtw.QWidget()
+        cluster_scroll.setWidget(cluster_scroll_container)
+        container_layout = qtw.QVBoxLayout()
+        cluster_scroll_container.setLayout(container_layout)
+
+        self.cluster_figure = mpl.figure.Figure()
+        self.cluster_canvas = FigureCanvas(self.cluster_figure)
+        self.cluster_canvas.setParent(self.cluster_widget)
+        self.cluster_canvas.setFocusPolicy(qtcore.Qt.StrongFocus)
+        self.cluster_canvas.setFocus()
+        self.cluster_canvas.setSizePolicy(qtw.QSizePolicy.Preferred,
+                                          qtw.QSizePolicy.Preferred)
+
+        self.mpl_toolbar = NavigationToolbar(self.cluster_canvas,
+                                             cluster_scroll_container)
+
+        # Adds widget for buttons and labels below figure
+        self.info_widget = qtw.QWidget(cluster_scroll_container)
+        info_layout = qtw.QGridLayout()
+
+        self.cluster_buttons = qtw.QWidget()
+        buttons_layout = qtw.QHBoxLayout(self.cluster_buttons)
+        buttons_layout.setContentsMargins(0, 0, 0, 0)
+        buttons_layout.addWidget(self.gb.make_widget(qtw.QPushButton(
+            " Clustering Preferences "), "clicked", self.cluster_options))
+
+        self.lasso_btn = self.gb.make_widget(qtw.QPushButton(
+            "Lasso Select"), "clicked",
+            partial(self.cluster_selector_change, "cluster", rect=False))
+        self.rect_btn = self.gb.make_widget(qtw.QPushButton(
+            "Rectangle Select"), "clicked",
+            partial(self.cluster_selector_change, "cluster", rect=True))
+
+        font = qtgui.QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+
+        self.view_all_btn = self.gb.make_widget(qtw.QPushButton(
+            "View Records in All Clusters"), "clicked", self.view_clusters)
+        buttons_layout.addWidget(self.view_all_btn)
+        self.cluster_title = self.gb.make_widget(qtw.QLabel("Clusters"),
+                                                 font=font)
+        info_layout.addWidget(self.cluster_title, 0, 0)
+
+        self.lasso_rect_widget = qtw.QWidget()
+        lasso_rect_layout = qtw.QHBoxLayout(self.lasso_rect_widget)
+        lasso_rect_layout.setContentsMargins(0, 0, 0, 0)
+        lasso_rect_layout.addStretch(2)
+        lasso_rect_layout.addWidget(self.lasso_btn)
+        lasso_rect_layout.addWidget(self.rect_btn)
+        info_layout.addWidget(self.lasso_rect_widget, 0, 1, 1, 2)
+
+        # Pools of labels and cluster rows, reused by each clustering
+        self.cluster_matrix_font = qtgui.QFont()
+        self.cluster_matrix_font.setPointSize(9)
+        self.cluster_matrix_font.setBold(True)
+        self.cluster_matrix_labels = []
+        self.cluster_rows = []
+        self.cluster_cids = []
+
+        self.info_widget.setLayout(info_layout)
 
         container_layout.addWidget(self.cluster_canvas, 2)
         container_layout.addWidget(self.mpl_toolbar)
@@ -1905,7 +2432,6 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
 
         vbox.addWidget(cluster_scroll)
         self.cluster_widget.setLayout(vbox)
-        self.cluster_widget.show()
 
 
     def cluster_options(self):
@@ -1955,15 +2481,21 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         method_items = list(self.cluster_methods.keys())
         cur_method = method_items.index(str(self.cluster_method))
 
+        # Builds each method's preferences once; choosing a method only
+        # switches between them
+        self.method_prefs_stack = qtw.QStackedWidget()
+        self.method_prefs_pages = {}
+        for method in method_items:
+            self.method_prefs_pages[method] = self.make_method_prefs(method)
+            self.method_prefs_stack.addWidget(self.method_prefs_pages[method])
+
+        method_prefs_box = qtw.QGroupBox("Preferences")
+        qtw.QVBoxLayout(method_prefs_box).addWidget(self.method_prefs_stack)
+
         self.method_list = self.gb.make_widget(
             qtw.QComboBox(), "currentIndexChanged",
             self.cluster_method_choice, items=method_items)
 
-        self.method_prefs_layout = qtw.QGridLayout()
-        self.method_prefs_layout.setVerticalSpacing(10)
-        method_prefs_box = qtw.QGroupBox("Preferences")
-        method_prefs_box.setLayout(self.method_prefs_layout)
-
         options_layout.addWidget(self.method_list, 1, 0)
         options_layout.addWidget(method_prefs_box, 1, 1, 3, 3)
         options_layout.addWidget(self.gb.make_widget(
@@ -1971,6 +2503,8 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         self.method_list.setCurrentIndex(cur_method)
         self.cluster_method_choice(self.method_list.findText(
             self.cluster_method))
+        self.options_widget.setSizePolicy(qtw.QSizePolicy.Minimum,
+                                          qtw.QSizePolicy.Minimum)
         self.options_widget.show()
 
 
@@ -1994,83 +2528,97 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
             clustering method.
         """
         self.cluster_method = self.method_list.itemText(item)
+        self.method_prefs_stack.setCurrentWidget(
+            self.method_prefs_pages[self.cluster_method])
+
+
+    def make_method_prefs(self, method):
+        """Creates the preference widgets for a clustering method.
+
+        Parameters
+        ----------
+        method : str
+            The clustering method ("Hierarchical" or "Spectral").
+
+        Returns
+        -------
+        prefs_widget : QWidget
+            The widget holding the method's preferences.
 
-        # Removes old clustering preferences
-        for layout_index in reversed(range(len(self.method_prefs_layout))):
+        See Also
+        --------
+        cluster_options: Creates the widget that lets the user pick clustering
+            options.
+        cluster_method_choice: Shows the preferences of the chosen method.
+        """
 
-            item = self.method_prefs_layout.itemAt(layout_index)
-            self.method_prefs_layout.removeItem(item)
-            item.widget().setParent(None)
+        prefs_widget = qtw.QWidget()
+        prefs_layout = qtw.QGridLayout(prefs_widget)
+        prefs_layout.setContentsMargins(0, 0, 0, 0)
+        prefs_layout.setVerticalSpacing(10)
 
         # Adds hierarchical clustering preferences
-        if self.cluster_method == "Hierarchical":
+        if method == "Hierarchical":
 
             hier_cluster_items = ["Single", "Complete", "Average", "Weighted",
                                   "Centroid", "Median", "Ward"]
             cur_pref = str(self.hier_prefs["method"][0]).title()
             cur_index = hier_cluster_items.index(cur_pref)
 
-            self.method_prefs_layout.addWidget(self.gb.make_widget(
+            prefs_layout.addWidget(self.gb.make_widget(
                 qtw.QComboBox(), "currentIndexChanged", self.update_pref,
                 items=hier_cluster_items, index=cur_index,
                 add_to=self.hier_prefs["method"], is_partial=True), 0, 1)
-            self.method_prefs_layout.addWidget(self.gb.make_widget(
+            prefs_layout.addWidget(self.gb.make_widget(
                 qtw.QLabel("Method:"), add_to=self.hier_prefs["method"]),
                 0, 0)
 
             trunc_items = ["No truncation","Last P clusters", "Up to P levels"]
-            self.method_prefs_layout.addWidget(self.gb.make_widget(
+            prefs_layout.addWidget(self.gb.make_widget(
                 qtw.QComboBox(), "currentIndexChanged", self.update_pref,
                 items=trunc_items, add_to=self.hier_prefs["truncate_mode"],
                 is_partial=True), 1, 1)
-            self.method_prefs_layout.addWidget(self.gb.make_widget(
+            prefs_layout.addWidget(self.gb.make_widget(
                 qtw.QLabel("Truncation:"),
                 add_to=self.hier_prefs["truncate_mode"]), 1, 0)
 
-            self.method_prefs_layout.addWidget(self.gb.make_widget(
+            prefs_layout.addWidget(self.gb.make_widget(
                 qtw.QSpinBox(), "valueChanged", self.update_pref, value=10,
                 minimum=1, add_to=self.hier_prefs["p"], is_partial=True), 2, 1)
-            self.method_prefs_layout.addWidget(self.gb.make_widget(
+            prefs_layout.addWidget(self.gb.make_widget(
                 qtw.QLabel("P:"), add_to=self.hier_prefs["p"]), 2, 0)
 
 
         # Adds spectral clustering preferences
-        elif self.cluster_method == "Spectral":
-            self.method_prefs_layout.addWidget(self.gb.make_widget(
+        elif method == "Spectral":
+            prefs_layout.addWidget(self.gb.make_widget(
                 qtw.QSpinBox(), "valueChanged", self.update_pref,
                 value=self.spectral_prefs["n_clusters"][0], minimum=1,
                 add_to=self.spectral_prefs["n_clusters"], is_partial=True),
                 0, 1)
-            self.method_prefs_layout.addWidget(self.gb.make_widget(
+            prefs_layout.addWidget(self.gb.make_widget(
                 qtw.QLabel("Clusters:"),
                 add_to=self.spectral_prefs["n_clusters"]), 0, 0)
 
-            self.method_prefs_layout.addWidget(self.gb.make_widget(
+            prefs_layout.addWidget(self.gb.make_widget(
                 qtw.QSpinBox(), "valueChanged", self.update_pref,
                 value=self.spectral_prefs["n_clusters"][0], minimum=1,
                 add_to=self.spectral_prefs["n_components"], is_partial=True),
                 1, 1)
-            self.method_prefs_layout.addWidget(self.gb.make_widget(
+            prefs_layout.addWidget(self.gb.make_widget(
                 qtw.QLabel("Components:"),
                 add_to=self.spectral_prefs["n_components"]), 1, 0)
 
-            self.method_prefs_layout.addWidget(self.gb.make_widget(
-                qtw.QSpinBox(), "valueChanged", self.update_pref, value=10,
-                minimum=1, add_to=self.spectral_prefs["n_init"],
-                is_partial=True), 2, 1)
-            self.method_prefs_layout.addWidget(self.gb.make_widget(
-                qtw.QLabel("Runs:"), add_to=self.spectral_prefs["n_init"]),
-                2, 0)
-            self.method_prefs_layout.addWidget(self.gb.make_widget(
+            prefs_layout.addWidget(self.gb.make_widget(
                 qtw.QDoubleSpinBox(), "valueChanged", self.update_pref,
                 value=0.0, minimum=1, add_to=self.spectral_prefs["eigen_tol"],
-                is_partial=True), 3, 1)
-            self.method_prefs_layout.addWidget(self.gb.make_widget(
+                is_partial=True), 2, 1)
+            prefs_layout.addWidget(self.gb.make_widget(
                 qtw.QLabel("Eigen tolerance:"),
-                add_to=self.spectral_prefs["eigen_tol"]), 3, 0)
+                add_to=self.spectral_prefs["eigen_tol"]), 2, 0)
+
+        return prefs_widget
 
-        self.options_widget.setSizePolicy(qtw.QSizePolicy.Minimum,
-                                          qtw.QSizePolicy.Minimum)
 
     def view_clusters(self, matrix_name=None, cluster_name=None):
         """Displays the records in each cluster.
@@ -2103,14 +2651,12 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
             return
 
 
+        records = self.data_set.records_by_id()
         if matrix_name:
 
             self.display_title = matrix_name +" Cluster #%d"%(cluster_name + 1)
             items = self.clusters[matrix_name][cluster_name]
-            self.selected_records = []
-            for cur_id in items:
-                cur_record = self.data_set.record_from_id(cur_id)
-                self.selected_records.append(cur_record)
+            self.selected_records = [records[cur_id] for cur_id in items]
 
             self.view_selected_records()
 
@@ -2123,10 +2669,8 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
                     self.display_title = (matrix_name +
                                           " Cluster #%d" % (cluster_name + 1))
 
-                    self.selected_records = []
-                    for cur_id in items:
-                        cur_record = self.data_set.record_from_id(cur_id)
-                        self.selected_records.append(cur_record)
+                    self.selected_records = [records[cur_id]
+                                             for cur_id in items]
 
                     self.view_selected_records()
 
@@ -2153,24 +2697,19 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         """
 
 
+        records = self.data_set.records_by_id()
         for matrix_name in self.clusters:
 
             grouping_title = str(self.cluster_grouping_index) + str(
                 ": " + matrix_name + " " + self.cluster_method + " Clustering")
-            self.data_set.groupings[grouping_title] = {}
-
-            for cluster_name in self.clusters[matrix_name]:
+            self.data_set.groupings[grouping_title] = {
+                grouping_title[:-3] + " " + str(cluster_name + 1): list(items)
+                for cluster_name, items in self.clusters[matrix_name].items()}
 
-                group_title = grouping_title[:-3] + " " + str(cluster_name + 1)
-
-                new_group = []
-                for cur_id in self.clusters[matrix_name][cluster_name]:
-                    cur_record = self.data_set.record_from_id(cur_id)
-
-                    cur_record.groups.append(group_title)
-                    new_group.append(cur_id)
-
-                self.data_set.groupings[grouping_title][group_title]=new_group
+            for group_title, items in self.data_set.groupings[
+                grouping_title].items():
+                for cur_id in items:
+                    records[cur_id].groups.append(group_title)
 
         self.cluster_grouping_index += 1
 
@@ -2225,6 +2764,8 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         they correspond, and stores the root of the tree for each matrix in
         `self.roots`.
         `self.tree_coords` is a list of nodes and their x and y values.
+        `self.hier_note_info` holds the text and position of each node's
+        annotation, in the same layout as `self.annotations["cluster"]`.
 
         Parameters
         ----------
@@ -2249,105 +2790,104 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
 
         self.tree_coords = {}
         self.roots = {}
+        self.hier_note_info = []
         self.annotations["cluster"] = []
+        self.note_lookup["cluster"] = {}
         self.artists["cluster"] = []
+
+        # Clusters the matrices in parallel, one per thread
+        with ThreadPoolExecutor(
+            max_workers=len(self.selected_matrices)) as executor:
+            linkage_matrices = list(executor.map(self.get_linkage_matrix,
+                                                 self.selected_matrices))
+
         for m_index, matrix_name in enumerate(self.selected_matrices):
 
-            self.current_cluster_axes[m_index]=self.cluster_figure.add_subplot(
+            axis = self.cluster_figure.add_subplot(
                 len(self.selected_matrices), 1, m_index+1)
+            self.current_cluster_axes[m_index] = axis
 
-            cur_matrix = self.data_set.matrices[matrix_name]["matrix"]
-            num_matrix = np.nan_to_num(cur_matrix)
-            hier_method = self.hier_prefs["method"][0].lower()
-            linkage_matrix = linkage(num_matrix, hier_method)
+            matrix_info = self.data_set.matrices[matrix_name]
+            linkage_matrix = linkage_matrices[m_index]
 
             # Makes dendrogram
-            self.current_cluster_axes[m_index].set_title(matrix_name)
-            self.current_cluster_axes[m_index].set_xlabel("IDs")
-            self.current_cluster_axes[m_index].set_ylabel(
-                self.data_set.matrices[matrix_name]["type"])
+            axis.set_title(matrix_name)
+            axis.set_xlabel("IDs")
+            axis.set_ylabel(matrix_info["type"])
 
             args,kwargs = self.get_cluster_args(dendrogram, self.hier_prefs,
-                                         [linkage_matrix],
-                                         self.current_cluster_axes[m_index])
+                                         [linkage_matrix], axis)
 
             ddata = dendrogram( *args, **kwargs )
 
-            self.roots[matrix_name] = to_tree(linkage_matrix)
+            # nodes[i] is the ClusterNode with ID i
+            self.roots[matrix_name], nodes = to_tree(linkage_matrix, rd=True)
             self.tree_coords[matrix_name] = [] # stores x, y, node
-            xvals = ddata['icoord'] # icoords correspond to x values
-            heights = [item[1] for item in ddata['dcoord']] # dcoords=y values
+            xvals = np.asarray(ddata['icoord']) # icoords correspond to x vals
+            heights = np.asarray(ddata['dcoord'])[:, 1] # dcoords=y values
 
             # Non-singleton clusters start here (e.g., if there are 100
             # records, records 0-99 correspond to original nodes; nodes 100+
             # correspond to tree nodes that combine those records)
-            total_ids = len(cur_matrix)
-            indexed_heights = np.array(
-                [[num for num in range(len(heights))], heights])
+            total_ids = len(matrix_info["matrix"])
+            node_children = [[record.id] for record
+                             in self.data_set.records[:total_ids]]
 
             # Stores each node and the corresponding coordinates. The lowest y
             # value goes with the first node, second-lowest with the second,...
+            # (a stable sort keeps ties in dendrogram order). The x value is
+            # the average of the left and right subtree branches' coordinates.
+            height_order = np.argsort(heights, kind="stable")
+            left_xs = xvals[height_order, 1]
+            right_xs = xvals[height_order, 3]
+            node_xs = .5 * (left_xs + right_xs)
             matrix_annotations = []
             leaf_annotations = []
-            blue_coords = []
-            for cur_id in range(total_ids, 2*total_ids-1):
-                mincol = np.argmin(indexed_heights[1]) # index of highest y val
-                minindex = int(indexed_heights[0][mincol])
-                ymin = indexed_heights[1][mincol] # highest y value
-
-                # corresponding x value
-                # (average coordinates of left and right subtree branches)
-                x = .5 * (xvals[minindex][1] + xvals[minindex][3])
+            for cur_id, x, ymin, left_x, right_x in zip(
+                    range(total_ids, 2*total_ids-1), node_xs.tolist(),
+                    heights[height_order].tolist(), left_xs.tolist(),
+                    right_xs.tolist()):
 
                 self.tree_coords[matrix_name].append([cur_id, x, ymin])
-                indexed_heights = np.delete(indexed_heights, mincol, 1)
 
 
                 # Adds annotations
-                parent = self.get_node_with_id(self.roots[matrix_name], cur_id)
-                children = [self.data_set.records[child].id
-                            for child in parent.pre_order()]
-                node_text = "\n".join(wrap("IDs: " + ", ".join(children), 30))
-                note = self.current_cluster_axes[m_index].annotate(
-                    node_text, xy=(x, ymin), arrowprops=dict(arrowstyle='->'),
-                    bbox=dict(boxstyle="round", fc="w"))
-                note.draggable()
-                note.set_visible(False)
-                matrix_annotations.append(note)
+                # Children IDs in pre-order (left subtree, then right)
+                parent = nodes[cur_id]
+                children = (node_children[parent.get_left().get_id()]
+                            + node_children[parent.get_right().get_id()])
+                node_children.append(children)
+                node_text = "IDs: " + ", ".join(children)
+                if len(node_text) > 30:
+                    node_text = "\n".join(wrap(node_text, 30))
+                matrix_annotations.append((node_text, (x, ymin)))
 
                 if len(children) == 2:
-                    blue_coords.append(xvals[minindex][1])
-                    blue_coords.append(xvals[minindex][3])
-
-                    note1 = self.current_cluster_axes[m_index].annotate(
-                        children[0], xy=(xvals[minindex][1], 0),
-                        arrowprops=dict(arrowstyle='->'),
-                        bbox=dict(boxstyle="round", fc="w"))
-                    note1.draggable()
-                    note1.set_visible(False)
-
-                    note2 = self.current_cluster_axes[m_index].annotate(
-                        children[1], xy=(xvals[minindex][3], 0),
-                        arrowprops=dict(arrowstyle='->'),
-                        bbox=dict(boxstyle="round", fc="w"))
-                    note2.draggable()
-                    note2.set_visible(False)
-
-                    leaf_annotations.append(note1)
-                    leaf_annotations.append(note2)
-
-            self.annotations["cluster"].append(matrix_annotations)
-            self.annotations["cluster"].append(leaf_annotations)
+                    leaf_annotations.append((children[0], (left_x, 0)))
+                    leaf_annotations.append((children[1], (right_x, 0)))
+
+            # The annotations themselves are made by get_hier_note when first
+            # hovered over
+            for note_info in [matrix_annotations, leaf_annotations]:
+                note_index = len(self.hier_note_info)
+                self.hier_note_info.append(note_info)
+                self.annotations["cluster"].append([None] * len(note_info))
+                for index, (text, xy) in enumerate(note_info):
+                    self.note_lookup["cluster"].setdefault(text, []).append(
+                        (note_index, index))
 
             # Adds red circles to tree nodes
             circle_xs = [coord[1] for coord in self.tree_coords[matrix_name]]
             circle_ys = [coord[2] for coord in self.tree_coords[matrix_name]]
-            new_artist, = self.current_cluster_axes[m_index].plot(
-                circle_xs, circle_ys, 'ro', picker=5)
+            new_artist, = axis.plot(circle_xs, circle_ys, 'ro', picker=5)
             self.artists["cluster"].append(new_artist)
 
-            blue_artist, = self.current_cluster_axes[m_index].plot(
-                blue_coords, np.zeros(len(blue_coords)), 'bo', picker=5)
+            # Adds blue circles to the individual IDs of nodes that join two
+            # records (the linkage rows whose two clusters are both records)
+            joins_records = (linkage_matrix[:, :2] < total_ids).all(axis=1)
+            blue_xs = np.column_stack((left_xs, right_xs))[joins_records].ravel()
+            blue_artist, = axis.plot(
+                blue_xs, np.zeros(len(blue_xs)), 'bo', picker=5)
             self.artists["cluster"].append(blue_artist)
 
         height = min(self.screen_geometry.height(),
@@ -2355,44 +2895,60 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         self.cluster_widget.setGeometry(40, 40, 1500, height)
 
 
-    def get_node_with_id(self, root, cur_id):
-        """Given an id, recursively finds and returns that node in the tree.
+    def get_linkage_matrix(self, matrix_name):
+        """Performs hierarchical clustering on one matrix.
+
+        Only does the computations, without plotting, so that several
+        matrices can be clustered at once in separate threads.
 
         Parameters
         ----------
-        root : ClusterNode
-            The root of the subtree to search.
-        cur_id : int
-            The ClusterNode ID to search for (not a record ID).
+        matrix_name : str
+            The name of the matrix to cluster.
 
         Returns
         -------
-        None
+        numpy.ndarray
+            The linkage matrix encoding the hierarchical clustering.
 
         See Also
         --------
-        cluster: Plots the results of the chosen clustering method.
-
+        hierarchical_clustering: Performs hierarchical clustering.
         """
 
-        if root is None or root.get_id() == cur_id:
-            return root
-
-        left_node = self.get_node_with_id(root.get_left(), cur_id)
-        right_node = self.get_node_with_id(root.get_right(), cur_id)
-
-        if left_node is not None:
-            return left_node
-        elif right_node is not None:
-            return right_node
+        cur_matrix = self.data_set.matrices[matrix_name]["matrix"]
+        hier_method = self.hier_prefs["method"][0].lower()
+
+        # Reclustering with a method used before reuses its linkage
+        cached = self.linkage_cache.get((matrix_name, hier_method))
+        if cached is not None and cached[0] is cur_matrix:
+            return cached[1]
+
+        # Changing the dtype copies the matrix; otherwise, nan_to_num copies
+        # it, leaving the data set's matrix as is
+        num_matrix = np.asarray(cur_matrix, dtype=self.cluster_dtype)
+        num_matrix = np.nan_to_num(num_matrix, copy=num_matrix is cur_matrix)
+
+        # Distance matrices are clustered on directly (in condensed form), not
+        # on the distances between their rows
+        if (self.data_set.matrices[matrix_name]["type"] != "Similarity"
+            and is_valid_dm(num_matrix, tol=1e-10)):
+            linkage_matrix = linkage(squareform(num_matrix, checks=False),
+                                     hier_method)
+        else:
+            linkage_matrix = linkage(num_matrix, hier_method)
 
-        return None
+        self.linkage_cache[(matrix_name, hier_method)] = (cur_matrix,
+                                                          linkage_matrix)
+        return linkage_matrix
 
 
     def show_spectral_clustering(self):
         """Performs spectral clustering on the data.
 
-        Clusters are stored in `self.clusters`.
+        Clusters are stored in `self.clusters`. For each plot,
+        `self.cluster_note_offsets` holds how far above a point its annotation
+        is shown.
 
         Parameters
         ----------
@@ -2420,71 +2976,63 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         self.clusters = {}
         self.annotations["cluster"] = []
         self.artists["cluster"] = []
-        self.cur_points = []
-        self.selectors = []
+        self.cluster_note_offsets = []
+        self.pt_index_cluster = None
+        self.cluster_points = []
+        self.cluster_selector = None
         cur_marker = self.marker_style_options[
             self.settings["Marker shape"][0].capitalize()]
-        for m_index, matrix_name in enumerate(self.selected_matrices):
+        record_ids = np.array([record.id for record in self.data_set.records],
+                              dtype=object)
 
-            self.current_cluster_axes[m_index]=self.cluster_figure.add_subplot(
-                1, len(self.selected_matrices), m_index+1)
+        # Clusters the matrices in parallel, one per thread
+        with ThreadPoolExecutor(
+            max_workers=len(self.selected_matrices)) as executor:
+            results = list(executor.map(self.spectral_cluster_matrix,
+                                        self.selected_matrices))
 
-            cur_matrix = self.data_set.matrices[matrix_name]["matrix"]
-            score_matrix0 = np.nan_to_num(np.array(cur_matrix))
-            score_matrix = np.maximum(score_matrix0, score_matrix0.T)
+        for m_index, matrix_name in enumerate(self.selected_matrices):
 
-            similarity_matrix = score_matrix.max() - score_matrix
+            axis = self.cluster_figure.add_subplot(
+                1, len(self.selected_matrices), m_index+1)
+            self.current_cluster_axes[m_index] = axis
 
-            args,kwargs = self.get_cluster_args(
-                spectral_clustering, self.spectral_prefs, [similarity_matrix],
-                self.current_cluster_axes[m_index])
+            self.labels[matrix_name], all_pts = results[m_index]
+            labels = self.labels[matrix_name]
 
-            self.labels[matrix_name] = spectral_clustering( *args, **kwargs )
+            # Record indices sorted by label (and by index within a label)
+            label_order = np.argsort(labels, kind="stable")
 
-            # Stores clusters
-            self.clusters[matrix_name] = {}
-            for item_index, item in enumerate(self.labels[matrix_name]):
-                if not item in self.clusters[matrix_name]:
-                    self.clusters[matrix_name][item] = []
-                self.clusters[matrix_name][item].append(
-                    self.data_set.records[item_index].id)
+            # Stores clusters, splitting the IDs sorted by label
+            cluster_ids, counts = np.unique(labels, return_counts=True)
+            self.clusters[matrix_name] = {
+                cluster_id: items.tolist() for cluster_id, items in zip(
+                    cluster_ids, np.split(record_ids[label_order],
+                                          np.cumsum(counts)[:-1]))}
 
             # Graphs the clusters
-            mds2 = MDS(2, dissimilarity='precomputed')
-            all_pts = mds2.fit_transform(score_matrix) #NEW
             x, y = all_pts.T
-            self.cur_points.append([x, y])
-            self.current_cluster_axes[m_index].set_title(
-                matrix_name + " (MDS view)")
+            self.cluster_points.append(all_pts.T)
+            axis.set_title(matrix_name + " (MDS view)")
 
-            self.annotations["cluster"].append({})
+            # Each plot has one annotation, made by get_cluster_note and moved
+            # to whichever record is hovered over
+            self.annotations["cluster"].append(None)
             self.artists["cluster"].append({})
-            for cluster_id in range(self.spectral_prefs["n_clusters"][0]):
-                cl_x, cl_y = all_pts[self.labels[matrix_name]==cluster_id,:].T
-                cur_artist, = self.current_cluster_axes[m_index].plot(
+            self.cluster_note_offsets.append(.05*(y.max() - y.min()))
+            n_clusters = self.spectral_prefs["n_clusters"][0]
+            for cluster_id, cluster_indices in enumerate(np.split(
+                    label_order, np.searchsorted(labels[label_order],
+                                                 np.arange(1, n_clusters)))):
+                cl_x, cl_y = all_pts[cluster_indices].T
+                cur_artist, = axis.plot(
                     cl_x, cl_y, marker=cur_marker, ls="", picker=10)
 
-                # Adds annotations
-                group_annotations = []
-                for item in self.clusters[matrix_name][cluster_id]:
-                    cur_index = self.data_set.index_from_id(item)
-                    note_y = y[cur_index] + .05*(max(y)-min(y))
-                    note = self.current_cluster_axes[m_index].annotate(
-                        item, xy=(x[cur_index], y[cur_index]),
-                        xytext=(x[cur_index], note_y),
-                        arrowprops=dict(arrowstyle='->'), bbox=dict(
-                        boxstyle="round", fc="w"))
-                    note.set_visible(False)
-                    group_annotations.append(note)
-
-                self.annotations[
-                        "cluster"][m_index][cluster_id] = group_annotations
-                self.artists[
-                        "cluster"][m_index][cluster_id] = cur_artist
+                self.artists["cluster"][m_index][cluster_id] = cur_artist
 
-            self.selectors.append(RectangleSelector(
-                self.current_cluster_axes[m_index],
-                partial(self.plot_rect, m_index)))
+        # The selector starts on the first plot, in case the mouse is already
+        # over it, and follows the mouse to the others
+        self.cluster_selector = self.make_cluster_selector(0)
 
         window_x = min(self.screen_geometry.width(),
                        550*len(self.selected_matrices) + 50)
@@ -2494,6 +3042,69 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         self.store_cluster_groupings()
 
 
+    def spectral_cluster_matrix(self, matrix_name):
+        """Performs spectral clustering on one matrix and gets its MDS view.
+
+        Only does the computations, without plotting, so that several
+        matrices can be clustered at once in separate threads.
+
+        Parameters
+        ----------
+        matrix_name : str
+            The name of the matrix to cluster.
+
+        Returns
+        -------
+        labels : numpy.ndarray
+            The cluster label of each record.
+        all_pts : numpy.ndarray
+            The 2D MDS coordinates of each record.
+
+        See Also
+        --------
+        show_spectral_clustering: Performs spectral clustering on the data.
+        """
+
+        # Changing the dtype copies the matrix; otherwise, nan_to_num copies
+        # it, so it can be symmetrized in place
+        cur_matrix = self.data_set.matrices[matrix_name]["matrix"]
+        score_matrix = np.asarray(cur_matrix, dtype=self.cluster_dtype)
+        score_matrix = np.nan_to_num(score_matrix,
+                                     copy=score_matrix is cur_matrix)
+        np.maximum(score_matrix, score_matrix.T, out=score_matrix)
+
+        similarity_matrix = score_matrix.max() - score_matrix
+
+        # For large matrices, only the affinities to each record's nearest
+        # neighbors are kept, so ARPACK works on a sparse Laplacian
+        n_records = len(similarity_matrix)
+        if n_records > SPARSE_SPECTRAL_MIN_RECORDS:
+            n_neighbors = min(SPARSE_SPECTRAL_NEIGHBORS, n_records // 10)
+            neighbors = np.argpartition(
+                similarity_matrix, n_records - n_neighbors,
+                axis=1)[:, -n_neighbors:].ravel()
+            rows = np.repeat(np.arange(n_records), n_neighbors)
+            knn_matrix = sparse.csr_matrix(
+                (similarity_matrix[rows, neighbors], (rows, neighbors)),
+                shape=similarity_matrix.shape)
+            similarity_matrix = .5 * (knn_matrix + knn_matrix.T)
+
+        args,kwargs = self.get_cluster_args(
+            spectral_clustering, self.spectral_prefs, [similarity_matrix])
+
+        labels = spectral_clustering( *args, **kwargs )
+
+        # The MDS view only depends on the matrix, so reclustering it reuses
+        # the view
+        cached = self.cluster_mds_cache.get(matrix_name)
+        if cached is None or cached[0] is not cur_matrix:
+            mds2 = MDS(2, dissimilarity='precomputed')
+            cached = (cur_matrix, mds2.fit_transform(score_matrix))
+            self.cluster_mds_cache[matrix_name] = cached
+
+        return labels, cached[1]
+
+
     def get_cluster_args(self, method, dictionary, initial, axis=None):
         """Returns clustering parameters for a clustering method.
 
@@ -2521,10 +3132,11 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
 
         """
 
-        method_parameters = list( inspect.signature( method ).parameters.items() )
-        # parameter_names = inspect.getargspec(method)[0]
-        # parameter_defaults = inspect.getargspec(method)[3]
-        #parameter_names = list( nethod_parameters.keys() )
+        # Each method's signature is only inspected once
+        method_parameters = self.cluster_parameters.get(method)
+        if method_parameters is None:
+            method_parameters = list(inspect.signature(method).parameters.items())
+            self.cluster_parameters[method] = method_parameters
 
         # parameter_values = initial
         additional_parameters = {}
@@ -2642,8 +3254,8 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
 
                 row_items = str(cur_table.item(
                     item.row(), 0).text()).split("and")
-                record1 = self.data_set.record_from_id(row_items[0].strip())
-                record2 = self.data_set.record_from_id(row_items[1].strip())
+                record1 = self.find_record(row_items[0].strip())
+                record2 = self.find_record(row_items[1].strip())
                 new_records = [record1, record2]
 
                 if new_records not in self.selected_records:
@@ -2680,12 +3292,71 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
 ###############################################################################
 # Record viewing methods
 
+    def find_record(self, id_num):
+        """Returns the record with the given ID.
+
+        Looks the ID up in `record_lookup`, which is rebuilt whenever the
+        data set's record list is replaced or changes length, rather than
+        searching the records.
+
+        Parameters
+        ----------
+        id_num : str
+            The ID of the record to retrieve.
+
+        Returns
+        -------
+        record : DataRecord
+            The record with the given ID, or -1 if the record was not found.
+
+        See Also
+        --------
+        DataSet.record_from_id: Searches the records for an ID.
+        """
+
+        records = self.data_set.records
+        if (self.record_lookup is None or self.record_lookup[0] is not records
+            or self.record_lookup[1] != len(records)):
+            self.record_lookup = (records, len(records),
+                                  self.data_set.records_by_id())
+
+        return self.record_lookup[2].get(id_num, -1)
+
+
+    def records_selected(self, new_records):
+        """Checks whether the given records are the ones already selected.
+
+        Parameters
+        ----------
+        new_records : list of DataRecord
+            The records to compare with `selected_records`, in any order.
+
+        Returns
+        -------
+        bool
+            True if `selected_records` holds the same records (not record
+            pairs), and False otherwise.
+        """
+
+        if self.selected_records and isinstance(self.selected_records[0],
+                                                list):
+            return False
+
+        # Picking the same point again gives the records in the same order
+        if len(new_records) == len(self.selected_records) and all(
+                new is old for new, old in zip(new_records,
+                                               self.selected_records)):
+            return True
+
+        return frozenset(new_records) == frozenset(self.selected_records)
+
+
     def view_selected_records(self):
         """Sets up initial figure for record viewing.
 
         Creates one figure per selected data type. `figure_info` stores
-        each figure and its buttons, data type, title, and the index of the
-        first record it displays.
+        each figure and its buttons, data type, title, the records with files
+        of its data type, and the index of the first record it displays.
 
         Parameters
         ----------
@@ -2740,21 +3411,35 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
                         self.data_set.fig_index, (100, 20+80*index, w, h),
                         self.data_set.icon, (fig_w, fig_h), min_size)
 
+                    # Only pages through the records (or pairs) with files
+                    # of this data type, unless none of them have any
+                    record_list = []
+                    for records in self.selected_records:
+                        pair = records if isinstance(records, list) else [
+                            records]
+                        if any(data_type in record.files for record in pair):
+                            record_list.append(records)
+                    if len(record_list) == 0:
+                        record_list = list(self.selected_records)
+
                     self.data_set.fig_index += 1
-                    buttons = self.add_plots(fig_widget.fig, 0, data_type)
+                    buttons = self.add_plots(fig_widget.fig, 0, data_type,
+                                             record_list=record_list)
 
                     # Stores figure info (start=index of first record shown)
                     fig_info.append({"figure": fig_widget.fig,
                                      "buttons": buttons, "canvas": None,
                                      "data type": data_type, "start": 0,
                                      "title": self.display_title,
+                                     "records": record_list,
                                      "widget": fig_widget})
 
             self.figure_info[self.selection_id] = fig_info
             self.selection_id += 1
 
 
-    def add_plots(self, fig, show_start, data_type, title=None):
+    def add_plots(self, fig, show_start, data_type, title=None,
+                  plot_axes=None, record_list=None):
         """Adds specific plots inside the given figure.
 
         If displaying individual records, displays each record on a separate
@@ -2772,6 +3457,12 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
             The data type of the files to display.
         title : str, optional
             The title to give to the figure.
+        plot_axes : list of matplotlib.axes.Axes, optional
+            Existing axes of the figure to reuse, one per record or pair to
+            display; by default, new axes are added.
+        record_list : list, optional
+            The records (or pairs of records) to page through; defaults to
+            `selected_records`.
 
         Returns
         -------
@@ -2791,15 +3482,20 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         if not title:
             title = self.display_title
 
+        if record_list is None:
+            record_list = self.selected_records
+
         show_end = show_start + self.settings["Plots per page"][0]
-        records_to_show = self.selected_records[show_start : show_end]
+        records_to_show = record_list[show_start : show_end]
         dim = math.ceil(math.sqrt(min(self.settings["Plots per page"][0],
                                       len(records_to_show))))
 
         for index, record in enumerate(records_to_show):
 
             records = records_to_show[index]
-            if len(records_to_show) == 2:
+            if plot_axes is not None:
+                axes = plot_axes[index]
+            elif len(records_to_show) == 2:
                 axes = fig.add_subplot(1, 2, index+1)
             else:
                 axes = fig.add_subplot(dim, dim, index+1)
@@ -2838,11 +3534,12 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
 
                 # Displays similarity/dissimilarity scores under pair
                 scores = ""
+                index1 = self.data_set.records.index(record1)
+                index2 = self.data_set.records.index(record2)
                 for matrix_name in self.selected_matrices:
 
                     matrix = self.data_set.matrices[matrix_name]["matrix"]
-                    cur_score = str(matrix[self.data_set.records.index(
-                        record1)][self.data_set.records.index(record2)])
+                    cur_score = str(matrix[index1][index2])
                     if cur_score == None or cur_score == "nan":
                         cur_score = "Unavailable"
                     scores += (
@@ -2890,7 +3587,7 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         bprev=None
 
         plots_remaining = show_start + self.settings["Plots per page"][0]
-        if plots_remaining < len(self.selected_records):
+        if plots_remaining < len(record_list):
             bnext = Button(fig.add_axes([0.89, 0.007, 0.1, 0.055]), 'Next')
             bnext.on_clicked(partial(self.change_figure, fig, 1))
 
@@ -2925,33 +3622,50 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
 
         """
 
-        for self.selection_id in self.figure_info:
-            for figure_data in self.figure_info[self.selection_id]:
+        for selection_id in self.figure_info:
+            for figure_data in self.figure_info[selection_id]:
                 if figure_data["figure"] == fig:
 
-                    for all_figure_data in self.figure_info[self.selection_id]:
+                    for all_figure_data in self.figure_info[selection_id]:
 
                         cur_fig = all_figure_data["figure"]
-                        cur_fig.clf()
 
                         # Determines amount of forward/backward change
-                        direction_change = self.settings[
-                            "Plots per page"][0]*sign
-
-                        all_figure_data["start"] += direction_change
-
-                        if all_figure_data["start"] < len(
-                            self.selected_records):
+                        per_page = self.settings["Plots per page"][0]
+                        record_list = all_figure_data["records"]
+                        old_start = all_figure_data["start"]
+                        new_start = old_start + per_page*sign
+
+                        # Each data type pages its own records, so figures
+                        # with fewer records stay on their first or last page
+                        if 0 <= new_start < len(record_list):
+                            all_figure_data["start"] = new_start
+
+                            # Pages with as many plots as the current one
+                            # reuse its axes; only the buttons are replaced
+                            plot_axes = None
+                            if (len(record_list[
+                                    old_start : old_start+per_page])
+                                == len(record_list[
+                                    new_start : new_start+per_page])):
+                                button_axes = [
+                                    button.ax for button in
+                                    all_figure_data["buttons"]
+                                    if button is not None]
+                                plot_axes = [axes for axes in cur_fig.axes
+                                             if axes not in button_axes]
+                                for axes in button_axes:
+                                    axes.remove()
+                            else:
+                                cur_fig.clf()
 
                             all_figure_data["buttons"] = self.add_plots(
-                                cur_fig, all_figure_data["start"],
+                                cur_fig, new_start,
                                 all_figure_data["data type"],
-                                all_figure_data["title"])
-                            cur_fig.canvas.draw()
-
-                        else:
-                            self.gb.loading_error("data files")
-                            return
+                                all_figure_data["title"], plot_axes,
+                                record_list)
+                            cur_fig.canvas.draw_idle()
+                    return
         return
 
 
@@ -2985,43 +3699,80 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         None
         """
 
-        text_widget = self.gb.make_widget(qtw.QStackedWidget(),
+        # Windows the user has closed are deleted rather than kept hidden
+        for old_window in self.text_widgets:
+            if not old_window.isVisible():
+                del self.text_info[old_window.findChild(qtw.QStackedWidget)]
+                old_window.deleteLater()
+        self.text_widgets = [old_window for old_window in self.text_widgets
+                             if old_window.isVisible()]
+
+        text_window = self.gb.make_widget(qtw.QWidget(),
                                           window_title=data_type)
-        text_widget.setWindowIcon(self.data_set.icon)
+        text_window.setWindowIcon(self.data_set.icon)
+        text_widget = qtw.QStackedWidget()
 
+        # One pair of buttons pages through all of the window's pages
+        records_list = list(self.selected_records)
         texts_per_pg = self.settings["Plots per page"][0]
-        font = qtgui.QFont()
+        prev_button = self.gb.make_widget(qtw.QPushButton("Previous"),
+            "clicked", partial(self.prev_texts, text_widget))
+        next_button = self.gb.make_widget(qtw.QPushButton("Next"),
+            "clicked", partial(self.next_texts, text_widget))
 
-        num_shown = 0
-        for records in self.selected_records:
+        button_layout = qtw.QHBoxLayout()
+        for button in [prev_button, next_button]:
+            button.setVisible(len(records_list) > texts_per_pg)
+            button_layout.addWidget(button)
 
-            if num_shown % texts_per_pg == 0:
-                cur_layer = qtw.QWidget()
-                cur_layout = qtw.QGridLayout()
-                cur_layer.setLayout(cur_layout)
-                text_widget.addWidget(cur_layer)
+        window_layout = qtw.QVBoxLayout(text_window)
+        window_layout.addWidget(text_widget)
+        window_layout.addLayout(button_layout)
 
-                font.setPointSize(12)
-                font.setBold(True)
+        # Later pages are only built when they are first paged to
+        self.text_info[text_widget] = (records_list, data_type, texts_per_pg,
+                                       prev_button, next_button)
+        self.change_text_page(text_widget, 0)
 
-                cur_layout.addWidget(self.gb.make_widget(
-                    qtw.QLabel(data_type), font=font), 0, 0)
-
-                button_layout = qtw.QHBoxLayout()
-                if num_shown > 0:
-                    button_layout.addWidget(self.gb.make_widget(
-                        qtw.QPushButton("Previous"), "clicked",
-                        partial(self.prev_texts, text_widget)),
-                        2*texts_per_pg+1)
-                if num_shown + texts_per_pg < len(self.selected_records):
-                    button_layout.addWidget(self.gb.make_widget(
-                        qtw.QPushButton("Next"), "clicked",
-                        partial(self.next_texts, text_widget)),
-                        2*texts_per_pg+1)
-                cur_layout.addLayout(button_layout, 2*texts_per_pg+3, 0, 1, 2)
-
-            font.setPointSize(11)
-            font.setBold(False)
+        self.text_widgets.append(text_window)
+        text_window.show()
+
+
+    def make_text_page(self, widget, page):
+        """Builds a page of text descriptions.
+
+        Parameters
+        ----------
+        widget : QStackedWidget
+            The window of text descriptions the page belongs to.
+        page : int
+            The index of the page to build.
+
+        Returns
+        -------
+        cur_layer : QWidget
+            The page of text descriptions.
+
+        See Also
+        --------
+        show_text : displays a window of text descriptions.
+
+        """
+
+        records_list, data_type, texts_per_pg = self.text_info[widget][:3]
+
+        cur_layer = qtw.QWidget()
+        cur_layer.setUpdatesEnabled(False)
+        cur_layout = qtw.QGridLayout()
+        cur_layer.setLayout(cur_layout)
+
+        cur_layout.addWidget(self.gb.make_widget(
+            qtw.QLabel(data_type), font=get_font(12, bold=True)), 0, 0)
+
+        num_shown = page*texts_per_pg
+        font = get_font(11)
+
+        for records in records_list[num_shown:num_shown+texts_per_pg]:
 
             if isinstance(records, list):
                 title_label = "Records "+records[0].id+" and "+records[1].id
@@ -3062,17 +3813,52 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
 
                 num_shown+=1
 
-        self.text_widgets.append(text_widget)
-        text_widget.show()
+        cur_layer.setUpdatesEnabled(True)
+        return cur_layer
+
+
+    def change_text_page(self, widget, page):
+        """Shows a page of text descriptions, building it if needed.
+
+        Pages are built in order, so a page that has not been built yet is
+        always the next one. The window's Previous and Next buttons are
+        enabled only if there is a page to move to.
+
+        Parameters
+        ----------
+        widget : QStackedWidget
+            The pages of text descriptions.
+        page : int
+            The index of the page to show.
+
+        Returns
+        -------
+        None
+
+        See Also
+        --------
+        make_text_page : builds a page of text descriptions.
+        """
+
+        records_list, data_type, texts_per_pg, prev_button, next_button = (
+            self.text_info[widget])
+
+        widget.setUpdatesEnabled(False)
+        if page == widget.count():
+            widget.addWidget(self.make_text_page(widget, page))
+        widget.setCurrentIndex(page)
+        widget.setUpdatesEnabled(True)
 
+        prev_button.setEnabled(page > 0)
+        next_button.setEnabled((page+1)*texts_per_pg < len(records_list))
 
     def next_texts(self, widget):
         """Moves to the next page of text descriptions.
 
         Parameters
         ----------
-        widget : QWidget
-            The figure to change.
+        widget : QStackedWidget
+            The pages of text descriptions.
 
         Returns
         -------
@@ -3080,15 +3866,17 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
 
         """
 
-        widget.setCurrentIndex(widget.currentIndex() + 1)
+        records_list, data_type, texts_per_pg = self.text_info[widget][:3]
+        if (widget.currentIndex()+1)*texts_per_pg < len(records_list):
+            self.change_text_page(widget, widget.currentIndex() + 1)
 
     def prev_texts(self, widget):
         """Moves to the previous page of text descriptions.
 
         Parameters
         ----------
-        widget : QWidget
-            The figure to change.
+        widget : QStackedWidget
+            The pages of text descriptions.
 
         Returns
         -------
@@ -3096,11 +3884,65 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
 
         """
 
-        widget.setCurrentIndex(widget.currentIndex() - 1)
+        if widget.currentIndex() > 0:
+            self.change_text_page(widget, widget.currentIndex() - 1)
 
 ###############################################################################
 # Selection methods
 
+    def throttle_hover(self, handler, event, debounce=False):
+        """Passes a mouse motion event to a hover handler, at most once a frame.
+
+        Only the latest event is kept; the handler gets it when
+        `hover_timer` times out, so motion events arriving faster than the
+        screen refreshes do not each walk the plot's artists.
+
+        Parameters
+        ----------
+        handler : function
+            The hover handler, called with the event.
+        event : matplotlib.backend_bases.MouseEvent
+            The mouse motion event.
+        debounce : {False, True}
+            If True, restarts the timer on every event, so the handler only
+            runs once the mouse stops moving.
+
+        Returns
+        -------
+        None
+
+        See Also
+        --------
+        run_pending_hover: Calls the hover handler with the latest event.
+        """
+
+        self.pending_hover = (handler, event)
+        if debounce or not self.hover_timer.isActive():
+            self.hover_timer.start()
+
+
+    def run_pending_hover(self):
+        """Calls the hover handler stored by `throttle_hover`, if any.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        See Also
+        --------
+        throttle_hover: Stores a mouse motion event for a hover handler.
+        """
+
+        if self.pending_hover is not None:
+            handler, event = self.pending_hover
+            self.pending_hover = None
+            handler(event)
+
+
     def plot_hover(self, plot_type, event):
         """Displays a record's ID when hovering over it on the plot.
 
@@ -3132,41 +3974,67 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
             current_notes = self.annotations["cluster"]
             pt_index = self.pt_index_cluster
 
-        # If colored by group
-        if self.color_grouping or isinstance(current_artists[0], dict):
-
+        # Spectral clusterings have one artist per cluster and one note per
+        # plot, which is moved to the hovered record in every plot. The
+        # nearest record is found among all of the plot's points at once,
+        # within the artists' pick radius, rather than testing each cluster.
+        if plot_type == "cluster":
             new_index = None
-            text = None
             for axis_index, axis in enumerate(current_axes):
                 if event.inaxes == axis:
 
-                    for group_name in current_artists[axis_index]:
-                        cont, ind = current_artists[axis_index][
-                            group_name].contains(event)
+                    pickradius = next(iter(current_artists[
+                        axis_index].values())).get_pickradius()
+                    points = axis.transData.transform(
+                        self.cluster_points[axis_index].T)
+                    distances = np.hypot(points[:, 0] - event.x,
+                                         points[:, 1] - event.y)
+                    nearest = int(distances.argmin())
+                    if distances[nearest] <= pickradius*axis.figure.dpi/72:
+                        new_index = nearest
+                    break
 
-                        if cont:
-                            new_index = ind["ind"][0]
-                            text = current_notes[
-                                axis_index][group_name][new_index].get_text()
+            if new_index is None:
+                self.cur_note = None
+                for note in current_notes:
+                    if note is not None:
+                        note.set_visible(False)
 
-                            for axis_notes in current_notes:
-                                for group in axis_notes:
-                                        for note in axis_notes[group]:
-                                            if note.get_text() == text:
-                                                note.set_visible(True)
-                            break
+            elif new_index != pt_index:
+                self.cur_note = self.data_set.records[new_index].id
+                for axis_index, (x, y) in enumerate(self.cluster_points):
+                    note = self.get_cluster_note(axis_index)
+                    note.xy = (x[new_index], y[new_index])
+                    note.set_position((x[new_index], y[new_index]
+                                       + self.cluster_note_offsets[axis_index]))
+                    note.set_text(self.cur_note)
+                    note.set_visible(True)
 
-            # Removes old point's annotation
-            if pt_index is not None and pt_index != new_index:
+        # If colored by group
+        elif self.color_grouping:
 
-                for axis_notes in current_notes:
-                    for group in axis_notes:
-                        for note in axis_notes[group]:
+            # MDS plots store one artist per axis, with the notes in point
+            # order; note_lookup finds every plot's note with the same ID
+            note_lookup = self.note_lookup[plot_type]
+            new_index = None
+            text = None
+            for axis_index, axis in enumerate(current_axes):
+                if event.inaxes == axis:
+
+                    cont, ind = current_artists[axis_index].contains(event)
 
-                            cur_text = note.get_text()
+                    if cont:
+                        new_index = ind["ind"][0]
+                        text = current_notes[axis_index][new_index].get_text()
 
-                            if cur_text == self.cur_note:
-                                note.set_visible(False)
+                        for note in note_lookup[text]:
+                            note.set_visible(True)
+                        break
+
+            # Removes old point's annotation
+            if pt_index is not None and pt_index != new_index:
+                for note in note_lookup.get(self.cur_note, []):
+                    note.set_visible(False)
 
             self.cur_note = text
 
@@ -3194,7 +4062,8 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         if plot_type == "2d":
             self.pt_index_2d = new_index
         else:
-            axis.get_figure().canvas.draw()
+            if new_index != pt_index:
+                axis.get_figure().canvas.draw_idle()
 
             if plot_type == "3d":
                 self.pt_index_3d = new_index
@@ -3202,6 +4071,35 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
                 self.pt_index_cluster = new_index
 
 
+    def get_cluster_note(self, axis_index):
+        """Gets the hover annotation of a spectral clustering plot.
+
+        The annotation is created the first time it is needed.
+
+        Parameters
+        ----------
+        axis_index : int
+            The index of the plot in `current_cluster_axes`.
+
+        Returns
+        -------
+        matplotlib.text.Annotation
+            The annotation, to be moved to the hovered record.
+
+        See Also
+        --------
+        plot_hover: Displays a record's ID when hovering over it on the plot.
+        """
+
+        notes = self.annotations["cluster"]
+        if notes[axis_index] is None:
+            notes[axis_index] = self.current_cluster_axes[axis_index].annotate(
+                "", xy=(0, 0), arrowprops=dict(arrowstyle='->'),
+                bbox=dict(boxstyle="round", fc="w"))
+
+        return notes[axis_index]
+
+
     def plot_pick(self, event):
         """Displays the records associated with a clicked point on a plot.
 
@@ -3216,17 +4114,15 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         """
 
         if event.mouseevent.dblclick:
-            new_records = [self.data_set.record_from_id(self.cur_note)]
-
-            if (len(self.selected_records) == 0 or
-                isinstance(self.selected_records[0], list) or
-                set(tuple(new_records)) != set(tuple(self.selected_records))):
+            new_records = [self.find_record(self.cur_note)]
 
+            if not self.records_selected(new_records):
                self.selected_records = new_records
                self.view_selected_records()
 
 
-    def plot_rect(self, axis_index=None, eclick=None, erelease=None):
+    def plot_rect(self, axis_index=None, eclick=None, erelease=None,
+                  points=None):
         """Displays all record pairs in the selected rectangle of the plot.
 
         Parameters
@@ -3237,6 +4133,9 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
             The event where the user clicked on the plot.
         erelease: matplotlib.backend_bases.MouseEvent, optional
             The event where the mouse was released on the plot.
+        points : list of numpy.ndarray, optional
+            The (2, N) points of each plot, one per record, when they are
+            not `cur_points` (e.g., `cluster_points`).
 
         Returns
         -------
@@ -3253,39 +4152,29 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         # Checks that this was not a single click
         if not (x1 == x2 and y1 == y2):
 
-            mtx = self.data_set.matrices[
-                self.selected_matrices[axis_index]]["matrix"]
-            self.selected_records = []
-
             # Looks for points within the rectangle
-            xpts = self.cur_points[axis_index][0]
-            ypts = self.cur_points[axis_index][1]
-            npts = range(len(xpts))
-            pts = [pt for pt in npts
-                   if xmin < xpts[pt] < xmax and ymin < ypts[pt] < ymax]
-            for pt_index in pts:
-
-                if self.mv_plot_type  == "roc":
-
-                    # Gets the dissimilarity score for that (fpr, tpr) tuple
-                    cur_threshold = self.thresholds[axis_index][pt_index]
-
-                    # Finds the corresponding record pair
-                    for row_index, row in enumerate(mtx):
-                        for col_index, score in enumerate(row):
-
-                            if round(score, 7) == round(cur_threshold, 7):
-                                r1 = self.data_set.records[row_index]
-                                r2 = self.data_set.records[col_index]
-                                self.selected_records.append([r1, r2])
-                else:
-                    self.selected_records.append(
-                        self.data_set.records[pt_index])
+            if points is None:
+                points = self.cur_points
+            xpts, ypts = points[axis_index]
+            pts = np.flatnonzero((xmin < xpts) & (xpts < xmax)
+                                 & (ymin < ypts) & (ypts < ymax)).tolist()
+
+            if points is self.cur_points and self.mv_plot_type  == "roc":
+
+                # Finds the record pairs with the dissimilarity scores of
+                # those (fpr, tpr) tuples
+                self.selected_records = self.pairs_with_scores(
+                    self.selected_matrices[axis_index],
+                    [self.thresholds[axis_index][pt_index]
+                     for pt_index in pts])
+            else:
+                self.selected_records = [self.data_set.records[pt_index]
+                                         for pt_index in pts]
 
             self.view_selected_records()
 
 
-    def plot_lasso(self, axis_index=None, verts=None):
+    def plot_lasso(self, axis_index=None, verts=None, points=None):
         """Displays all record pairs in the selected lasso region of the plot.
 
         Parameters
@@ -3294,46 +4183,91 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
             The axis of the plot where the selection occurred.
         verts : list of list of float, optional
             The coordinates of the vertices of the lasso area.
+        points : list of numpy.ndarray, optional
+            The (2, N) points of each plot, one per record, when they are
+            not `cur_points` (e.g., `cluster_points`).
 
         Returns
         -------
         None
         """
 
-        self.selected_records = []
-        mtx = self.data_set.matrices[
-            self.selected_matrices[axis_index]]["matrix"]
+        # Looks for points within the lasso area
+        if points is None:
+            points = self.cur_points
+        pts = np.flatnonzero(path.Path(verts).contains_points(
+            points[axis_index].T)).tolist()
 
-        for pt_index, cur_x in enumerate(self.cur_points[axis_index][0]):
+        if points is self.cur_points and self.mv_plot_type == "roc":
 
-            cur_y = self.cur_points[axis_index][1][pt_index]
-            if path.Path(verts).contains_points([(cur_x, cur_y)]):
+            # Finds the record pairs with the dissimilarity scores of those
+            # (fpr, tpr) tuples
+            self.selected_records = self.pairs_with_scores(
+                self.selected_matrices[axis_index],
+                [self.thresholds[axis_index][pt_index] for pt_index in pts])
+        else:
+            self.selected_records = [self.data_set.records[pt_index]
+                                     for pt_index in pts]
 
-                if self.mv_plot_type == "roc":
+        self.view_selected_records()
 
-                    # Gets the dissimilarity score for that (fpr, tpr) tuple
-                    cur_threshold = self.thresholds[axis_index][pt_index]
 
-                    # Finds the corresponding record pair
-                    for row_index, row in enumerate(mtx):
-                        for col_index, score in enumerate(row):
+    def pairs_with_scores(self, matrix_name, scores):
+        """Finds the record pairs with the given scores in a matrix.
 
-                            if round(score, 7) == round(cur_threshold, 7):
-                                r1 = self.data_set.records[row_index]
-                                r2 = self.data_set.records[col_index]
-                                self.selected_records.append([r1, r2])
-                else:
-                    new_record = self.data_set.records[pt_index]
-                    self.selected_records.append(new_record)
+        Scores are compared to 7 decimal places. The matrix's sorted scores
+        are cached in `score_order_cache`, so each score is found by
+        bisection rather than by scanning the matrix.
 
-        self.view_selected_records()
+        Parameters
+        ----------
+        matrix_name : str
+            The name of the matrix to search.
+        scores : list of float
+            The scores to look for.
+
+        Returns
+        -------
+        list of list of DataRecord
+            The [row record, column record] pairs with each score, in the
+            order of `scores` and then in row-major order.
+
+        See Also
+        --------
+        plot_rect: Displays the record pairs in the selected rectangle.
+        plot_lasso: Displays the record pairs in the selected lasso region.
+        """
+
+        cur_matrix = self.data_set.matrices[matrix_name]["matrix"]
+        cached = self.score_order_cache.get(matrix_name)
+        if cached is None or cached[0] is not cur_matrix:
+            flat_scores = np.round(np.asarray(cur_matrix, dtype=float),
+                                   7).ravel()
+            score_order = np.argsort(flat_scores, kind="stable")
+            cached = (cur_matrix, score_order, flat_scores[score_order])
+            self.score_order_cache[matrix_name] = cached
+
+        _, score_order, sorted_scores = cached
+        n_columns = np.shape(cur_matrix)[1]
+        records = self.data_set.records
+
+        pairs = []
+        for score in np.round(np.asarray(scores, dtype=float), 7):
+            start = np.searchsorted(sorted_scores, score, side="left")
+            end = np.searchsorted(sorted_scores, score, side="right")
+            for flat_index in score_order[start:end].tolist():
+                row_index, col_index = divmod(flat_index, n_columns)
+                pairs.append([records[row_index], records[col_index]])
+
+        return pairs
 
 
     def mds_selector_change(self, event):
         """Changes MDS selectors from rectangle to lasso or vice versa.
 
-        `self.selectors` maintains a reference to each selector so that they
-        can be used after another figure is opened.
+        `self.mds_selectors` keeps both types of selectors, so switching
+        deactivates one type and activates the other. The lasso selectors are
+        made the first time they are chosen.
 
         Parameters
         ----------
@@ -3345,29 +4279,28 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         None
         """
 
-        text = str(self.lasso_rect.label.get_text())
-
-        for index, selector in enumerate(self.selectors):
+        # The button is labeled with the type to change to
+        new_type = str(self.lasso_rect.label.get_text())
+        old_type = "Rectangle" if new_type == "Lasso" else "Lasso"
 
-            ax = self.current_2d_axes[index]
+        if new_type == "Lasso" and not self.mds_selectors["Lasso"]:
+            self.mds_selectors["Lasso"] = [
+                LassoSelector(ax, partial(self.plot_lasso, index))
+                for index, ax in enumerate(self.current_2d_axes)]
 
-            if text == "Lasso":
-                self.lasso_rect.label.set_text("Rectangle")
-                self.selectors[index] = LassoSelector(
-                    ax, partial(self.plot_lasso, index))
+        for selector in self.mds_selectors[old_type]:
+            selector.set_active(False)
+        for selector in self.mds_selectors[new_type]:
+            selector.set_active(True)
 
-
-            else:
-                self.lasso_rect.label.set_text("Lasso")
-                self.selectors[index] = RectangleSelector(
-                    ax, partial(self.plot_rect, index))
+        self.lasso_rect.label.set_text(old_type)
 
 
     def cluster_selector_change(self, event, rect):
         """Changes clustering selectors from rectangle to lasso or vice versa.
 
-        `self.selectors` maintains a reference to each selector so that they
-        can be used after another figure is opened.
+        Replaces `self.cluster_selector` with a selector of the new type;
+        plots the mouse enters later get the same type.
 
         Parameters
         ----------
@@ -3381,20 +4314,77 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         None
         """
 
-        for index, selector in enumerate(self.selectors):
+        self.rect_btn.setDefault(rect)
+        self.lasso_btn.setDefault(not rect)
+        self.cluster_rect_select = rect
 
-            ax = self.current_cluster_axes[index]
-            if rect==True:
-                self.rect_btn.setDefault(True)
-                self.lasso_btn.setDefault(False)
-                self.selectors[index] = RectangleSelector(
-                    ax, partial(self.plot_rect, index))
+        if self.cluster_selector is not None:
+            self.cluster_selector.set_active(False)
+            self.cluster_selector = self.make_cluster_selector(
+                self.current_cluster_axes.index(self.cluster_selector.ax))
 
-            else:
-                self.lasso_btn.setDefault(True)
-                self.rect_btn.setDefault(False)
-                self.selectors[index] = LassoSelector(
-                    ax, partial(self.plot_lasso, index))
+
+    def move_cluster_selector(self, event):
+        """Moves the clustering selector to the plot under the mouse.
+
+        One selector is shared by all of the spectral clustering's plots, so
+        only the plot under the mouse handles selection events. The selector
+        is not moved while a mouse button is held, so a selection dragged
+        into a neighboring plot is finished by its own selector; it moves on
+        the next motion once the button is released.
+
+        Parameters
+        ----------
+        event: matplotlib.backend_bases.MouseEvent
+            The mouse motion event.
+
+        Returns
+        -------
+        None
+
+        See Also
+        --------
+        make_cluster_selector: Makes a selector for a clustering plot.
+        """
+
+        if (event.inaxes is None or (
+            self.cluster_selector is not None
+            and self.cluster_selector.ax is event.inaxes)
+            or event.inaxes not in self.current_cluster_axes
+            or qtw.QApplication.mouseButtons() != qtcore.Qt.NoButton):
+            return
+
+        if self.cluster_selector is not None:
+            self.cluster_selector.set_active(False)
+        self.cluster_selector = self.make_cluster_selector(
+            self.current_cluster_axes.index(event.inaxes))
+
+
+    def make_cluster_selector(self, index):
+        """Makes a rectangle or lasso selector for a clustering plot.
+
+        Parameters
+        ----------
+        index : int
+            The index of the plot in `current_cluster_axes`.
+
+        Returns
+        -------
+        matplotlib.widgets._SelectorWidget
+            The selector, depending on `cluster_rect_select`.
+
+        See Also
+        --------
+        cluster_selector_change: Changes the clustering selectors.
+        """
+
+        ax = self.current_cluster_axes[index]
+        if self.cluster_rect_select:
+            return RectangleSelector(ax, partial(
+                self.plot_rect, index, points=self.cluster_points))
+
+        return LassoSelector(ax, partial(
+            self.plot_lasso, index, points=self.cluster_points))
 
 
     def heat_click(self, event):
@@ -3418,7 +4408,7 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
             new_records = [self.data_set.records[int(event.xdata)],
                            self.data_set.records[int(event.ydata)]]
 
-            if set(tuple(new_records)) != set(tuple(self.selected_records)):
+            if not self.records_selected(new_records):
                self.selected_records = new_records
                self.view_selected_records()
 
@@ -3452,11 +4442,9 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
                 if redcont:
 
                     new_index = redind["ind"][0]
-                    new_note = self.annotations[
-                        "cluster"][note_index][new_index].get_text()
+                    new_note = self.hier_note_info[note_index][new_index][0]
 
-                    self.annotations[
-                        "cluster"][2*axis_index][new_index].set_visible(True)
+                    self.get_hier_note(note_index, new_index).set_visible(True)
                     break
 
                 # If the user hovers over a (blue) individual ID
@@ -3466,22 +4454,24 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
                 if bluecont:
 
                     new_index = blueind["ind"][0]
-                    new_note = self.annotations[
-                        "cluster"][note_index][new_index].get_text()
+                    new_note = self.hier_note_info[note_index][new_index][0]
 
+                    # Shows the ID in every matrix's dendrogram
                     if self.cur_note != new_note:
-                        for axis_notes in self.annotations["cluster"][1::2]:
-                            for note in axis_notes:
-                                if note.get_text() == new_note:
-                                    note.set_visible(True)
+                        for leaf_index, cur_index in self.note_lookup[
+                                "cluster"][new_note]:
+                            if leaf_index % 2 == 1:
+                                self.get_hier_note(
+                                    leaf_index, cur_index).set_visible(True)
                     break
 
         # Removes old point's annotation
         if self.cur_note is not None and self.cur_note != new_note:
-            for axis_notes in self.annotations["cluster"]:
-                for note in axis_notes:
-                    if note.get_text() == self.cur_note:
-                        note.set_visible(False)
+            notes = self.annotations["cluster"]
+            for note_index, index in self.note_lookup["cluster"].get(
+                    self.cur_note, []):
+                if notes[note_index][index] is not None:
+                    notes[note_index][index].set_visible(False)
 
         if self.cur_note != new_note:
             axis.get_figure().canvas.draw()
@@ -3490,6 +4480,43 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         self.cur_note = new_note
 
 
+    def get_hier_note(self, note_index, index):
+        """Gets an annotation of the hierarchical clustering's dendrograms.
+
+        The annotation is created the first time it is needed, so nodes that
+        are never hovered over do not build any.
+
+        Parameters
+        ----------
+        note_index : int
+            The index of the annotation list: 2*i for the nodes of the ith
+            dendrogram and 2*i + 1 for its individual IDs.
+        index : int
+            The index of the annotation in that list.
+
+        Returns
+        -------
+        matplotlib.text.Annotation
+            The (hidden) annotation.
+
+        See Also
+        --------
+        hier_hover: Displays all child IDs when the user hovers over a node.
+        """
+
+        notes = self.annotations["cluster"][note_index]
+        if notes[index] is None:
+            text, xy = self.hier_note_info[note_index][index]
+            note = self.current_cluster_axes[note_index // 2].annotate(
+                text, xy=xy, arrowprops=dict(arrowstyle='->'),
+                bbox=dict(boxstyle="round", fc="w"))
+            note.draggable()
+            note.set_visible(False)
+            notes[index] = note
+
+        return notes[index]
+
+
     def hier_pick(self, event):
         """When the user clicks on a node, displays all its child records.
 
@@ -3513,12 +4540,12 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
 
         if "IDs" in self.cur_note:
             ids = str(self.cur_note[4:]).replace("\n", " ").split(",")
-            new_records = [self.data_set.record_from_id(cur_id.strip())
+            new_records = [self.find_record(cur_id.strip())
                            for cur_id in ids]
         else:
-            new_records = [self.data_set.record_from_id(str(self.cur_note))]
+            new_records = [self.find_record(str(self.cur_note))]
 
-        if set(tuple(new_records)) != set(tuple(self.selected_records)):
+        if not self.records_selected(new_records):
             self.selected_records = new_records
             self.view_selected_records()
 
@@ -3559,11 +4586,10 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
 
 
             mnm_scores = self.data_set.match_nonmatch_scores[axis_name]
-            match_scores = [row[0] for row in mnm_scores["matches"]]
-            nonmatch_scores = [row[0] for row in mnm_scores["nonmatches"]]
-            all_scores = [row[0] for row in mnm_scores["all"]]
-            min_score = min(all_scores)
-            max_score = max(all_scores)
+            match_scores = mnm_scores["sorted match scores"]
+            nonmatch_scores = mnm_scores["sorted nonmatch scores"]
+            min_score = mnm_scores["min score"]
+            max_score = mnm_scores["max score"]
 
             score = None
             score_text = "Score: "
@@ -3581,16 +4607,25 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
                         axis = self.current_axes[axis_index]
 
                     if event.inaxes == axis:
-                        cont, ind = self.artists[
-                            "mv"][axis_index].contains(event)
+                        roc_artist = self.artists["mv"][axis_index]
+                        cont, ind = roc_artist.contains(event)
 
-                        # Sets note visible and adds to new notes
+                        # Moves note to the threshold and adds to new notes;
+                        # the curve's own data is used, since other plots
+                        # replace cur_points
                         if cont:
-                            new_note = self.annotations["mv"][
-                                axis_index][ind["ind"][0]]
+                            pt_index = ind["ind"][0]
+                            fpr, tpr = roc_artist.get_data()
+                            score = float(self.thresholds[axis_index][pt_index])
+                            threshold_text = format(score, '.4g')
+
+                            new_note = self.get_mv_note(axis, axis_index)
+                            new_note.set_text(threshold_text)
+                            new_note.xy = (fpr[pt_index], tpr[pt_index])
+                            new_note.set_position((fpr[pt_index] + .02,
+                                                   tpr[pt_index] + .02))
                             new_note.set_visible(True)
-                            score = float(new_note.get_text())
-                            score_text += str(format(score, '.4g'))
+                            score_text += threshold_text
                             new_notes.append(new_note)
 
                     score_text += "\nTrue Positive Rate: " + str(
@@ -3614,43 +4649,59 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
                     axis = self.current_axes[axis_index]
                     if event.inaxes == axis:
 
-                        cont, ind = self.artists[
-                            "mv"][axis_index][0].contains(event)
                         line_index = 0
+                        pt_index = self.linear_point_at(
+                            axis_index, line_index, event)
 
-                        if not cont:
-                            cont, ind = self.artists[
-                                "mv"][axis_index][1].contains(event)
+                        if pt_index is None:
                             line_index = 1
+                            pt_index = self.linear_point_at(
+                                axis_index, line_index, event)
 
-                        # Sets note visible and adds to new indices
-                        if cont:
+                        # Moves each axis's note to the same record pair,
+                        # unless the notes already show it
+                        if pt_index is not None:
                             new_index = []
-                            cur_note = self.annotations["mv"][
-                                axis_index][line_index][ind["ind"][0]]
-                            cur_note.set_visible(True)
-
-                            for axis_notes in self.annotations["mv"]:
-                                for index, note in enumerate(
-                                    axis_notes[line_index]):
-
-                                    note_text = note.get_text()
-                                    cur_text = cur_note.get_text()
-
-                                    if (note_text[:note_text.index(":")]
-                                        == cur_text[:cur_text.index(":")]):
-
-                                        note.set_visible(True)
-                                        new_index.append(index)
+                            line_type = ["matches", "nonmatches"][line_index]
+                            cur_info = mnm_scores[line_type][pt_index]
+                            pair = (cur_info[1], cur_info[2])
+                            moved = self.mv_note_pair != (line_index, pair)
+                            self.mv_note_pair = (line_index, pair)
+
+                            for note_index, note_axis in enumerate(
+                                self.current_axes):
+
+                                index = self.mv_pair_indices[note_index][
+                                    line_index].get(pair)
+                                if index is None:
+                                    continue
+
+                                note = self.get_mv_note(
+                                    note_axis, note_index, line_index)
+                                if moved:
+                                    info = self.data_set.match_nonmatch_scores[
+                                        self.selected_matrices[note_index]][
+                                        line_type][index]
+                                    note.set_text(info[1] + " and \n"
+                                        + info[2] + ": \n" + str(info[0]))
+                                    if line_index == 0:
+                                        note.xy = (info[0], .005)
+                                        note.set_position((info[0]+.005, .011))
+                                    else:
+                                        note.xy = (info[0], -.03)
+                                        note.set_position((info[0], -.05))
+
+                                note.set_visible(True)
+                                new_index.append(index)
+                                new_notes.append(note)
 
                 #Smooth histogram: displays match and nonmatch heights
                 elif self.mv_plot_type == "smooth histogram":
 
-                    x = np.linspace(0, max_score, 200)
-
-                    for index, point_set in enumerate(self.cur_points):
-                        match_height = np.interp(score, x, point_set[0])
-                        nonmatch_height = np.interp(score, x, point_set[1])
+                    x = self.smooth_xs[axis_index]
+                    point_set = self.cur_points[axis_index]
+                    match_height = np.interp(score, x, point_set[0])
+                    nonmatch_height = np.interp(score, x, point_set[1])
 
                     score_text += "\nMatches' height: " + str(
                         format(match_height, '.6g'))
@@ -3659,15 +4710,21 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
                     score_text += "\nMatch:nonmatch height ratio: " + str(
                         format(match_height/nonmatch_height, '.6g'))
 
-            # Fills in table
+            # Fills in table, repainting it once afterwards
+            stats_table = self.stats_tables[axis_index]
+            stats_table.setUpdatesEnabled(False)
+            stats_table.blockSignals(True)
             if score:
-                arr_matches = np.array(match_scores)
-                arr_nonmatches =np.array(nonmatch_scores)
+                arr_matches = match_scores
+                arr_nonmatches = nonmatch_scores
 
-                matches_left = np.where(arr_matches <= score)[0].size
-                matches_right = np.where(arr_matches > score)[0].size
-                nonmatches_left = np.where(arr_nonmatches <= score)[0].size
-                nonmatches_right = np.where(arr_nonmatches > score)[0].size
+                # The scores are sorted, so the counts are insertion points
+                matches_left = int(np.searchsorted(arr_matches, score,
+                                                   side="right"))
+                matches_right = len(arr_matches) - matches_left
+                nonmatches_left = int(np.searchsorted(arr_nonmatches, score,
+                                                      side="right"))
+                nonmatches_right = len(arr_nonmatches) - nonmatches_left
 
                 stats = [[matches_left, matches_right, len(arr_matches)],
                          [nonmatches_left, nonmatches_right,
@@ -3682,8 +4739,7 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
 
                 for rownum, row in enumerate(stats):
                     for colnum, item in enumerate(row):
-                        self.stats_tables[axis_index].setItem(
-                            rownum, colnum, qtw.QTableWidgetItem(str(item)))
+                        stats_table.item(rownum, colnum).setText(str(item))
 
             # If outside the matrix's range, clear the table
             else:
@@ -3693,28 +4749,24 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
 
                 for rownum in range(4):
                     for colnum in range(2):
-                        self.stats_tables[axis_index].setItem(
-                            rownum, colnum, qtw.QTableWidgetItem(""))
-
-            self.stats_labels[axis_index].setText(score_text)
+                        stats_table.item(rownum, colnum).setText("")
 
-            header = self.stats_tables[axis_index].horizontalHeader()
+            header = stats_table.horizontalHeader()
             header.setStretchLastSection(True)
+            stats_table.blockSignals(False)
+            stats_table.setUpdatesEnabled(True)
+
+            self.stats_labels[axis_index].setText(score_text)
 
 
         # For ROC and linear ordering, hides old annotations
         if self.mv_plot_type == "linear ordering":
 
             if self.pt_index_mv is not None and self.pt_index_mv != new_index:
-                for axis_index, axis_notes in enumerate(
-                    self.annotations["mv"]):
-
-                    cur_pt = self.pt_index_mv[axis_index]
-
-                    if len(axis_notes[0]) > cur_pt:
-                        axis_notes[0][cur_pt].set_visible(False)
-                    if len(axis_notes[1])>cur_pt:
-                        axis_notes[1][cur_pt].set_visible(False)
+                for axis_notes in self.annotations["mv"]:
+                    for note in axis_notes:
+                        if note is not None and note not in new_notes:
+                            note.set_visible(False)
 
             self.pt_index_mv = new_index
 
@@ -3727,8 +4779,243 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
 
             self.cur_mv_note = new_notes
 
-        if new_note or new_index:
-            self.current_axes[0].get_figure().canvas.draw()
+        # Only redraws when the shown notes change
+        self.mv_shown_notes = new_notes
+        note_state = [(note.get_text(), tuple(note.xy)) for note in new_notes]
+        if note_state != self.mv_note_state:
+            self.mv_note_state = note_state
+            self.blit_mv_notes(new_notes)
+
+
+    def get_mv_note(self, axis, note_index, line_index=None):
+        """Gets a hover annotation of the match visualization.
+
+        The annotation is created the first time it is needed, so plots that
+        are never hovered over do not build any.
+
+        Parameters
+        ----------
+        axis : matplotlib.axes.Axes
+            The axis to annotate.
+        note_index : int
+            The index of the matrix the annotation belongs to.
+        line_index : {None, 0, 1}, optional
+            For the linear ordering, 0 for the matched scores' annotation and
+            1 for the unmatched scores'.
+
+        Returns
+        -------
+        matplotlib.text.Annotation
+            The (hidden) annotation, to be moved to the hovered point.
+
+        See Also
+        --------
+        mv_hover: Shows information when hovering over the plot.
+        """
+
+        notes = self.annotations["mv"]
+        if line_index is not None:
+            notes = notes[note_index]
+            note_index = line_index
+
+        if notes[note_index] is None:
+            note = axis.annotate("", xy=(0, 0),
+                                 arrowprops=dict(arrowstyle='->'),
+                                 bbox=dict(boxstyle="round", fc="w"))
+            note.set_visible(False)
+            note.set_animated(True)
+            notes[note_index] = note
+
+        return notes[note_index]
+
+
+    def linear_point_at(self, axis_index, line_index, event):
+        """Finds the linear ordering point under the mouse, if any.
+
+        Bisects the line's sorted scores for the points nearest the mouse,
+        then checks whether the nearest is within the line's pick radius.
+
+        Parameters
+        ----------
+        axis_index : int
+            The index of the linear ordering's axis.
+        line_index : {0, 1}
+            0 for the matched scores' line and 1 for the unmatched scores'.
+        event : matplotlib.backend_bases.MouseEvent
+            The mouse event.
+
+        Returns
+        -------
+        int or None
+            The index of the point in the matrix's matches or nonmatches, or
+            None if the mouse is not over a point of the line.
+
+        See Also
+        --------
+        mv_hover: Shows information when hovering over the plot.
+        """
+
+        sorted_scores, order = self.mv_sorted_scores[axis_index][line_index]
+        if len(sorted_scores) == 0:
+            return None
+
+        position = np.searchsorted(sorted_scores, event.xdata)
+        nearest = [index for index in (position-1, position)
+                   if 0 <= index < len(sorted_scores)]
+        nearest = min(nearest, key=lambda index: abs(
+            sorted_scores[index] - event.xdata))
+
+        # Of equal scores, takes the first pair, as Line2D.contains would
+        nearest = np.searchsorted(sorted_scores, sorted_scores[nearest])
+
+        artist = self.artists["mv"][axis_index][line_index]
+        point_x, point_y = artist.axes.transData.transform(
+            (sorted_scores[nearest], [.005, -.03][line_index]))
+        radius = artist.get_pickradius() * artist.figure.dpi / 72.
+
+        if np.hypot(point_x - event.x, point_y - event.y) <= radius:
+            return order[nearest]
+        return None
+
+
+    def cache_mv_background(self, event=None):
+        """Stores the match visualization figure as drawn, without notes.
+
+        Hover annotations are animated, so they are left out of full draws
+        and can be blitted over this background. Connected to the canvas's
+        draw events, so the background is refreshed after every full draw
+        (e.g., when the window is resized), and the notes shown before the
+        draw are blitted back over it.
+
+        Parameters
+        ----------
+        event : matplotlib.backend_bases.DrawEvent, optional
+            The draw event that triggered storing the background.
+
+        Returns
+        -------
+        None
+
+        See Also
+        --------
+        blit_mv_notes: Draws hover annotations over the background.
+        """
+
+        self.mv_background = self.mv_canvas.copy_from_bbox(
+            self.mv_figure.bbox)
+        self.mv_note_state = None
+
+        # Full draws skip the animated notes, so the shown ones are redrawn
+        notes = [note for note in self.mv_shown_notes if note.get_visible()
+                 and note.axes in self.mv_figure.axes]
+        if notes:
+            for note in notes:
+                note.axes.draw_artist(note)
+            self.mv_canvas.blit(self.mv_figure.bbox)
+            self.cursor.clear(None)
+
+
+    def blit_mv_notes(self, notes):
+        """Draws hover annotations on the match visualization by blitting.
+
+        Restores the background stored by `cache_mv_background` and draws
+        only `notes` over it, rather than redrawing every artist of the
+        figure. The cursor's background is then refreshed so that moving the
+        cursor does not erase the notes.
+
+        Parameters
+        ----------
+        notes : list of matplotlib.text.Annotation
+            The visible annotations to draw.
+
+        Returns
+        -------
+        None
+
+        See Also
+        --------
+        mv_hover: Shows and hides annotations when hovering over the plot.
+        """
+
+        if self.mv_background is None:
+            self.mv_canvas.draw_idle()
+            return
+
+        self.mv_canvas.restore_region(self.mv_background)
+        for note in notes:
+            note.axes.draw_artist(note)
+        self.mv_canvas.blit(self.mv_figure.bbox)
+        self.cursor.clear(None)
+
+
+    def blit_mv_artists(self, artists):
+        """Adds artists to the match visualization by blitting.
+
+        Draws only `artists` over the background stored by
+        `cache_mv_background`, then stores the result as the new background,
+        so later hover annotations are blitted over the new artists too. The
+        artists are not animated, so full draws still include them.
+
+        Parameters
+        ----------
+        artists : list of matplotlib.artist.Artist
+            The artists that were added to the plots.
+
+        Returns
+        -------
+        None
+
+        See Also
+        --------
+        mv_click: Pins scores to the match visualization.
+        """
+
+        if self.mv_background is None:
+            self.mv_canvas.draw_idle()
+            return
+
+        self.mv_canvas.restore_region(self.mv_background)
+        for artist in artists:
+            artist.axes.draw_artist(artist)
+        self.mv_background = self.mv_canvas.copy_from_bbox(
+            self.mv_figure.bbox)
+        self.mv_note_state = None
+        self.mv_canvas.blit(self.mv_figure.bbox)
+        self.cursor.clear(None)
+
+
+    def score_bounds(self):
+        """Returns the score range of each selected matrix.
+
+        The ranges are kept in `score_bounds_cache` while the selected
+        matrices keep the same score dicts, so matrices whose scores are
+        regenerated or fused get new ranges.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        bounds : numpy.ndarray
+            For each selected matrix, its (min score, max score).
+
+        See Also
+        --------
+        mv_click: Pins a score to the plots whose range includes it.
+        """
+
+        mnm_scores = [self.data_set.match_nonmatch_scores[name]
+                      for name in self.selected_matrices]
+        if (self.score_bounds_cache is None
+                or len(self.score_bounds_cache[0]) != len(mnm_scores)
+                or any(cached is not scores for cached, scores in zip(
+                    self.score_bounds_cache[0], mnm_scores))):
+            self.score_bounds_cache = (mnm_scores, np.array(
+                [(scores["min score"], scores["max score"])
+                 for scores in mnm_scores], dtype=float).reshape(-1, 2))
+
+        return self.score_bounds_cache[1]
 
 
     def mv_click(self, event=None, prev_score=None):
@@ -3759,35 +5046,38 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
 
         """
 
-        if prev_score:
-            score = prev_score
-        else:
-            score = event.xdata
+        score = prev_score if prev_score is not None else event.xdata
 
-        bbox_style = dict(boxstyle="round", fc="w")
-        axis = None
         to_store = None
-        if prev_score or event.dblclick:
-            draw = False
+        draggable = (self.settings["Pinned notes"][0].capitalize()
+                     == "Draggable")
+
+        # Clicks outside the axes have no data coordinates
+        if prev_score is not None or (event.dblclick
+                                      and event.xdata is not None):
+            new_artists = []
 
-            for axis_index, axis_name in enumerate(self.selected_matrices):
+            # Only the plots whose score range includes the score get a line
+            if self.mv_plot_type == "roc":
+                axis_indices = range(len(self.selected_matrices))
+            else:
+                bounds = self.score_bounds()
+                axis_indices = np.flatnonzero((bounds[:, 0] <= score)
+                                              & (score <= bounds[:, 1]))
 
-                mnm_scores = self.data_set.match_nonmatch_scores[axis_name]
-                all_scores = [row[0] for row in mnm_scores["all"]]
-                min_score = min(all_scores)
-                max_score = max(all_scores)
+            for axis_index in axis_indices:
 
                 # If ROC, draw lines and annotate with the TPR and FPR
                 if self.mv_plot_type == "roc":
                     if not (self.use_1_plot and axis_index>0):
 
-                        if prev_score or (event.xdata>=0 and event.xdata<=1
-                                          and event.ydata>=0
-                                          and event.ydata<=1):
+                        if prev_score is not None or (
+                                0 <= event.xdata <= 1
+                                and 0 <= event.ydata <= 1):
 
                             axis = self.current_axes[axis_index]
 
-                            if prev_score:
+                            if prev_score is not None:
                                 score_x = prev_score[0]
                                 score_y = prev_score[1]
                             else:
@@ -3795,58 +5085,72 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
                                 score_y = event.ydata
                                 to_store = (score_x, score_y)
 
-                            axis.axvline(score_x, color='k', linestyle='--')
-                            axis.axhline(score_y, color='k', linestyle='--')
+                            new_artists.append(axis.axvline(
+                                score_x, color='k', linestyle='--'))
+                            new_artists.append(axis.axhline(
+                                score_y, color='k', linestyle='--'))
 
                             x_note = axis.annotate(
-                                "FPR: " + str(format(score_x, '.3g')),
+                                "FPR: " + format_score(score_x),
                                 xy=(score_x, 0), xycoords='data',
                                 xytext=(score_x, -.07),
                                 arrowprops=dict(arrowstyle='->'),
-                                bbox=bbox_style)
-                            x_note.draggable()
+                                bbox=PINNED_NOTE_BBOX)
+                            if draggable:
+                                x_note.draggable()
 
                             y_note = axis.annotate(
-                                "TPR: " + str(format(score_y, '.3g')),
+                                "TPR: " + format_score(score_y),
                                 xy=(0, score_y), xycoords='data',
                                 xytext=(-.16, score_y - .05),
                                 arrowprops=dict(arrowstyle='->'),
-                                bbox=bbox_style)
-                            y_note.draggable()
-
-                            draw = True
-
-                # If linear ordering, draws vertical line at score
-                elif score >= min_score and score <= max_score:
-
-                    axis = self.current_axes[axis_index]
-                    axis.axvline(score, color='k', linestyle='--')
-                    ymin, ymax = axis.get_ylim()
-                    note_height = .75*(ymax+ymin)
-                    text_height = (score, note_height)
-
-                    if self.mv_plot_type == "linear ordering":
-                        axis.plot(score, .005, 'gs')
-                        axis.plot(score, .005, 'gx', markersize=15)
-                        axis.plot(score, -.03, 'gs')
-                        axis.plot(score, -.03, 'gx', markersize=15)
-
-                        note_height = -.01
-                        text_height = (score+max_score/80, -.01)
-
-                    score_note = axis.annotate(
-                        str(format(score, '.3g')), xy=(score, note_height),
-                        xytext=text_height, arrowprops=dict(arrowstyle='->'),
-                        bbox=bbox_style)
+                                bbox=PINNED_NOTE_BBOX)
+                            if draggable:
+                                y_note.draggable()
+
+                            new_artists += [x_note, y_note]
+
+                    continue
+
+                # Draws vertical line at score
+                axis = self.current_axes[axis_index]
+                new_artists.append(
+                    axis.axvline(score, color='k', linestyle='--'))
+                ymin, ymax = axis.get_ylim()
+                note_height = .75*(ymax+ymin)
+                text_height = (score, note_height)
+                arrow_style = dict(arrowstyle='->')
+
+                # Marks the score on both lines, one artist per marker
+                if self.mv_plot_type == "linear ordering":
+                    new_artists += axis.plot([score, score], [.005, -.03],
+                                             'gs')
+                    new_artists += axis.plot([score, score], [.005, -.03],
+                                             'gx', markersize=15)
+
+                    # The note sits right beside the markers, so it needs no
+                    # arrow patch to redraw
+                    note_height = -.01
+                    text_height = (score+bounds[axis_index, 1]/80, -.01)
+                    arrow_style = None
+
+                score_note = axis.annotate(
+                    format_score(score), xy=(score, note_height),
+                    xytext=text_height, arrowprops=arrow_style,
+                    bbox=PINNED_NOTE_BBOX)
+                if draggable:
                     score_note.draggable()
+                new_artists.append(score_note)
 
-                    to_store = score
-                    draw = True
+                to_store = score
 
-            if draw:
-                axis.get_figure().canvas.draw()
+            # Scores added while replotting are drawn with the new plot
+            if new_artists and prev_score is not None:
+                self.mv_canvas.draw_idle()
+            elif new_artists:
+                self.blit_mv_artists(new_artists)
 
-        if to_store and not prev_score:
+        if to_store is not None and prev_score is None:
             self.interpolation_scores.append(to_store)
 
 
@@ -3876,13 +5180,13 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
 
             if self.mv_plot_type == "linear ordering":
 
-                for axis_index, axis in enumerate(self.current_axes):
-                    if event.mouseevent.inaxes == axis:
-                        mtx_name = axis.get_title()
-                        break
+                # The mouse can be just outside the axes within the pick
+                # radius, but the picked artist always knows its axes
+                axis_index = self.current_axes.index(event.artist.axes)
+                mtx_name = self.selected_matrices[axis_index]
 
                 # Check if match or nonmatch picked
-                if event.mouseevent.ydata > -.0125:
+                if event.artist is self.artists["mv"][axis_index][0]:
                     line_type = "matches"
                 else:
                     line_type = "nonmatches"
@@ -3890,15 +5194,11 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
                 info = self.data_set.match_nonmatch_scores[
                     mtx_name][line_type][self.pt_index_mv[axis_index]]
 
-                record1 = self.data_set.record_from_id(info[1])
-                record2 = self.data_set.record_from_id(info[2])
+                record1 = self.find_record(info[1])
+                record2 = self.find_record(info[2])
 
                 new_records = [record1, record2]
-                if (not self.selected_records
-                    or isinstance(self.selected_records[0], list)
-                    or set(tuple(new_records))
-                    != set(tuple(self.selected_records))):
-
+                if not self.records_selected(new_records):
                    self.selected_records = new_records
 
                 self.view_selected_records()
@@ -3925,7 +5225,23 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
         # Asks if the user wants to save this set of analyses (i.e. pickle it)
         # Only asks if 1 window is left open
         if not self.data_set.update and self.data_set.num_widgets_open < 2:
-                close = self.data_set.save(self)
+
+                # Hover and cursor timers must not fire while the data set is
+                # pickled in the background
+                timers = [self.hover_timer]
+                cursor_timer = getattr(getattr(self, "cursor", None),
+                                       "move_timer", None)
+                if cursor_timer is not None:
+                    timers.append(cursor_timer)
+                for timer in timers:
+                    timer.stop()
+                    timer.blockSignals(True)
+                try:
+                    close = self.data_set.save(self)
+                finally:
+                    for timer in timers:
+                        timer.blockSignals(False)
+
                 if close:
                     plt.close("all")
                     app = qtw.QApplication.instance()
@@ -3957,13 +5273,14 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
             Whether to display a horizontal line
         vertOn : {True, False}, optional
             Whether to display a vertical line
-        points : list of list, optional
-            The list of points on display.
+        points : list of numpy.ndarray, optional
+            For each matrix, the (2, N) array of the match and nonmatch
+            histograms' heights on display.
         visible : {True, False}, optional
             Determines whether to display the cursor
-        mnm : dict of {str : dict of {str : list}}
-            For each matrix, stores lists of match scores, nonmatch scores,
-            and all scores; same format as DataSet.match_nonmatch_scores.
+        xs : list of numpy.ndarray, optional
+            For each matrix, the scores at which the points' heights were
+            computed.
         selected_matrices : list of str, optional
             The names of the matrices on display.
 
@@ -3978,11 +5295,15 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
 
         Attributes
         ----------
-        match_nonmatch_scores : dict of list
-            For each matrix, stores lists of match scores, nonmatch scores,
-            and all scores; same format as DataSet.match_nonmatch_scores.
+        xs : list of numpy.ndarray
+            For each matrix, the scores at which the points' heights were
+            computed.
         cur_points : list of list
             The list of points being displayed.
+        match_hlines : list of matplotlib.lines.Line2D
+            For each axis, the line at the match histogram's height.
+        nonmatch_hlines : list of matplotlib.lines.Line2D
+            For each axis, the line at the nonmatch histogram's height.
         canvas : matplotlib.backend_bases.FigureCanvas
             The canvas on which the cursor is displayed
         axes : matplotlib.axes.Axes
@@ -3995,15 +5316,22 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
             Determines whether to display the cursor
         useblit : {True, False}, optional
             Determines whether to use blitting when rendering the cursor.
+        pending_event : matplotlib.backend_bases.MouseEvent
+            The latest mouse motion event not yet drawn, or None.
+        move_timer : PyQt5.QtCore.QTimer
+            Passes `pending_event` to `move_lines` at most once a frame.
+        lines_shown : {False, True}
+            Whether the lines' visibility matches `visible`. Reset by `clear`,
+            and should be reset whenever `visible` changes.
 
         """
 
         def __init__(self, canvas, axes, useblit=True, horizOn=False,
-                     vertOn=True, points=None, mnm=None,
+                     vertOn=True, points=None, xs=None,
                      selected_matrices=None, **lineprops):
 
 
-            self.match_nonmatch_scores = mnm
+            self.xs = xs
             self.selected_matrices = selected_matrices
             self.cur_points = points
 
@@ -4018,6 +5346,7 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
             ymid = 0.5 * (ymin + ymax)
 
             self.visible = True
+            self.lines_shown = False
             self.useblit = useblit and self.canvas.supports_blit
             self.background = None
             self.needclear = False
@@ -4031,18 +5360,79 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
             else:
                 self.vlines = []
 
+            # One horizontal line per axis for each histogram, in the
+            # histogram's color; `hlines` holds both for MultiCursor
             if horizOn:
-                self.hlines = [ax.axhline(ymid, visible=False, **lineprops)
-                               for ax in axes]
-                self.hlines += [ax.axhline(ymid, visible=False, **lineprops)
-                               for ax in axes]
+                self.match_hlines = [
+                    ax.axhline(ymid, visible=False,
+                               **dict(lineprops, color="blue"))
+                    for ax in axes]
+                self.nonmatch_hlines = [
+                    ax.axhline(ymid, visible=False,
+                               **dict(lineprops, color="red"))
+                    for ax in axes]
             else:
-                self.hlines = []
+                self.match_hlines = []
+                self.nonmatch_hlines = []
+            self.hlines = self.match_hlines + self.nonmatch_hlines
+
+            # Mouse motion only stores the latest event; the timer moves the
+            # lines to it
+            self.pending_event = None
+            self.move_timer = qtcore.QTimer()
+            self.move_timer.setSingleShot(True)
+            self.move_timer.setInterval(HOVER_INTERVAL_MS)
+            self.move_timer.timeout.connect(self.run_pending_move)
 
             self.connect()
 
 
         def onmove(self, event):
+            """Stores a mouse motion event for the cursor's lines to move to.
+
+            Only the latest event is kept; `move_timer` passes it to
+            `move_lines`, so the lines are redrawn at most once a frame
+            however fast motion events arrive.
+
+            Parameters
+            ----------
+            event : matplotlib.backend_bases.MouseEvent
+                The event that triggered changing the lines
+
+            Returns
+            -------
+            None
+
+            See Also
+            --------
+            move_lines: Moves the cursor's lines to a mouse position.
+
+            """
+
+            self.pending_event = event
+            if not self.move_timer.isActive():
+                self.move_timer.start()
+
+
+        def run_pending_move(self):
+            """Moves the cursor's lines to the event stored by `onmove`.
+
+            Parameters
+            ----------
+            None
+
+            Returns
+            -------
+            None
+            """
+
+            if self.pending_event is not None:
+                event = self.pending_event
+                self.pending_event = None
+                self.move_lines(event)
+
+
+        def move_lines(self, event):
             """Updates the cursor's lines when moving the mouse.
 
             Parameters
@@ -4069,37 +5459,42 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
             if not self.visible:
                 return
 
-            # Finds the heights of the histograms at the current x-coordinate
+            # Finds the heights of the histograms at the current x-coordinate,
+            # interpolating both rows of heights between the same grid points
+            # (and using the end heights outside the grid, as np.interp does)
             score = event.xdata
             heights = []
             for index, matrix_name in enumerate(self.selected_matrices):
 
-                mnm_scores = self.match_nonmatch_scores[matrix_name]
-                max_score = max([row[0] for row in mnm_scores["all"]])
-                x = np.linspace(0, max_score, 200)
-                heights.append(
-                    [np.interp(score, x, self.cur_points[index][0]),
-                     np.interp(score, x, self.cur_points[index][1])])
+                x = self.xs[index]
+                ys = self.cur_points[index]
+                left = min(max(int(np.searchsorted(x, score)) - 1, 0),
+                           len(x) - 2)
+                step = x[left+1] - x[left]
+                frac = min(max((score - x[left]) / step, 0), 1) if step else 0
+                heights.append(ys[:, left] + frac*(ys[:, left+1]
+                                                   - ys[:, left]))
+
+            # Shows the lines on the first move after they were hidden
+            if not self.lines_shown:
+                for line in self.vlines + self.hlines:
+                    line.set_visible(self.visible)
+                self.lines_shown = True
 
             # Redraws the vertical lines at the current x-coordinate
             if self.vertOn:
                 for line in self.vlines:
                     line.set_xdata((event.xdata, event.xdata))
-                    line.set_visible(self.visible)
 
             # Redraws the horizontal lines at the current y-coordinate
             if self.horizOn:
-                slice_end = int(len(self.hlines)/2)
-                for index, line in enumerate(self.hlines[:slice_end]):
-
-                    line.set_ydata((heights[index][0], heights[index][0]))
-                    line.set_visible(self.visible)
-                    line.set_color("blue")
+                for index, (match_line, nonmatch_line) in enumerate(
+                        zip(self.match_hlines, self.nonmatch_hlines)):
 
-                    self.hlines[index + slice_end].set_ydata((
-                        heights[index][1], heights[index][1]))
-                    self.hlines[index + slice_end].set_visible(self.visible)
-                    self.hlines[index + slice_end].set_color("red")
+                    match_line.set_ydata((heights[index][0],
+                                          heights[index][0]))
+                    nonmatch_line.set_ydata((heights[index][1],
+                                             heights[index][1]))
 
             self._update()
 
@@ -4126,12 +5521,33 @@ class VisualMetricAnalyzer(qtw.QMainWindow):
                     for ax, line in zip(self.axes, self.vlines):
                         ax.draw_artist(line)
                 if self.horizOn:
-                    for index, ax in enumerate(self.axes):
-                        ax.draw_artist(self.hlines[index])
-                        ax.draw_artist(
-                            self.hlines[index + int(len(self.hlines)/2)])
+                    for ax, match_line, nonmatch_line in zip(
+                            self.axes, self.match_hlines,
+                            self.nonmatch_hlines):
+                        ax.draw_artist(match_line)
+                        ax.draw_artist(nonmatch_line)
 
                 self.canvas.blit(self.canvas.figure.bbox)
             else:
                 self.canvas.draw_idle()
 
+
+        def clear(self, event):
+            """Stores the background and marks the lines as hidden.
+
+            Some matplotlib versions hide the lines when clearing, so the
+            next move shows them again.
+
+            Parameters
+            ----------
+            event : matplotlib.backend_bases.DrawEvent
+                The draw event, or None when called directly.
+
+            Returns
+            -------
+            None
+            """
+
+            super().clear(event)
+            self.lines_shown = False
+